@@ -13,6 +13,9 @@ _log = get_trace_logger()
 from utils.billing_date_utils import add_months, elapsed_months_inclusive, parse_ymd, today
 from utils.validation import normalize_whitespace
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_NON_DIGIT_RE = re.compile(r"\D")
+
 
 class DashboardMixin:
     def _resolve_dashboard_selected_field(self, selected_label: str) -> str:
@@ -72,8 +75,8 @@ class DashboardMixin:
             self.dashboard_search_tree.delete(item)
         self._dashboard_search_result_map = {}
 
-        query_plate = re.sub(r"[^a-z0-9]", "", query_l)
-        query_digits = re.sub(r"\D", "", query)
+        query_plate = _NON_ALNUM_RE.sub("", query_l)
+        query_digits = _NON_DIGIT_RE.sub("", query)
         query_has_alpha = any(ch.isalpha() for ch in query)
 
         def _matches(field_name: str, candidate: str) -> bool:
@@ -84,7 +87,7 @@ class DashboardMixin:
             if field_name == "plate":
                 if field not in ("all", "plate"):
                     return False
-                candidate_plate = re.sub(r"[^a-z0-9]", "", candidate_l)
+                candidate_plate = _NON_ALNUM_RE.sub("", candidate_l)
                 if not query_plate or not candidate_plate:
                     return False
                 return query_plate in candidate_plate
@@ -95,7 +98,7 @@ class DashboardMixin:
                 )
                 if field not in ("all", "phone") and not allow_phone_in_name_company_fallback:
                     return False
-                candidate_digits = re.sub(r"\D", "", candidate)
+                candidate_digits = _NON_DIGIT_RE.sub("", candidate)
                 if not query_digits or not candidate_digits:
                     return False
                 return query_digits in candidate_digits
@@ -143,11 +146,11 @@ class DashboardMixin:
         if lowered.startswith("contract ") and lowered.split(" ", 1)[1].isdigit():
             return "all"
 
-        phone_digits = re.sub(r"\D", "", text)
+        phone_digits = _NON_DIGIT_RE.sub("", text)
         if not has_alpha and len(phone_digits) >= 7:
             return "phone"
 
-        plate_compact = re.sub(r"[^a-z0-9]", "", lowered)
+        plate_compact = _NON_ALNUM_RE.sub("", lowered)
         if has_alpha and digit_count > 0 and 4 <= len(plate_compact) <= 12:
             return "plate"
 
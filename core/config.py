@@ -29,6 +29,7 @@ PHONE_PATTERN = re.compile(r"^[0-9()+\-.\s]{7,20}$")
 PLATE_PATTERN = re.compile(r"^[A-Z0-9\-\s]{2,15}$")
 STATE_PATTERN = re.compile(r"^[A-Z]{2}$")
 SEARCH_PLATE_PATTERN = re.compile(r"^[A-Z0-9\-\s]*$")
+DECIMAL_PATTERN = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
 
 
 # ============================================================================
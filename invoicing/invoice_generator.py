@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 import uuid
 from typing import Any, Mapping
 
@@ -75,16 +76,33 @@ class PdfInvoiceData:
     recent_payments: list[PdfPaymentLine]
 
 
+# Rows share a handful of start/end strings; date objects are immutable, so
+# repeated parses can return the cached result.
+@lru_cache(maxsize=1024)
 def _parse_ymd(value: str | None) -> date | None:
     if not value:
         return None
     try:
-        return datetime.strptime(value.strip(), "%Y-%m-%d").date()
+        cleaned = value.strip()
+        # Fast path for canonical ISO dates; anything else keeps strptime's rules.
+        if (
+            len(cleaned) == 10
+            and cleaned[4] == "-"
+            and cleaned[7] == "-"
+            and cleaned[:4].isdigit()
+            and cleaned[5:7].isdigit()
+            and cleaned[8:].isdigit()
+        ):
+            return date(int(cleaned[:4]), int(cleaned[5:7]), int(cleaned[8:]))
+        return datetime.strptime(cleaned, "%Y-%m-%d").date()
     except Exception:
         return None
 
 
 def _add_months(year: int, month: int, delta: int) -> tuple[int, int]:
+    if delta == 1:
+        # Fast path for the next-month step used by due-date calculation.
+        return (year + 1, 1) if month == 12 else (year, month + 1)
     m = month + delta
     y = year + (m - 1) // 12
     m = (m - 1) % 12 + 1
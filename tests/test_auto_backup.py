@@ -19,6 +19,15 @@ from core.config import AUTO_BACKUP_MAX_COPIES
 from core.settings_service import SettingsService
 
 
+class _BackupStub:
+    """Bare stand-in for a BackupStartupMixin host; cheaper than a spec'd mock."""
+
+    current_language = "en"
+
+    def _get_last_backup_date(self):
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Config constant
 # ---------------------------------------------------------------------------
@@ -73,8 +82,7 @@ class TestPromptAutoBackupDir(unittest.TestCase):
     @patch("app.mixins.backup_startup_mixin.filedialog")
     @patch("app.mixins.backup_startup_mixin.messagebox")
     def test_skips_if_dir_already_set(self, mock_mb, mock_fd):
-        mixin = MagicMock(spec=BackupStartupMixin)
-        mixin.current_language = "en"
+        mixin = _BackupStub()
         tmp = os.path.join(os.environ.get("TEMP", "/tmp"), "test_auto_bk")
         os.makedirs(tmp, exist_ok=True)
         mixin._get_auto_backup_dir = MagicMock(return_value=tmp)
@@ -150,7 +158,7 @@ class TestAutoBackupOnStartup(unittest.TestCase):
     def test_creates_backup_in_configured_dir(self):
         import tempfile
         with tempfile.TemporaryDirectory() as tmp:
-            mixin = MagicMock(spec=BackupStartupMixin)
+            mixin = _BackupStub()
             mixin._get_auto_backup_dir = MagicMock(return_value=tmp)
             mixin.db = MagicMock()
             mixin._log_action = MagicMock()
@@ -168,7 +176,7 @@ class TestAutoBackupOnStartup(unittest.TestCase):
     def test_handles_backup_failure_gracefully(self):
         import tempfile
         with tempfile.TemporaryDirectory() as tmp:
-            mixin = MagicMock(spec=BackupStartupMixin)
+            mixin = _BackupStub()
             mixin._get_auto_backup_dir = MagicMock(return_value=tmp)
             mixin.db = MagicMock()
             mixin.db.backup_to.side_effect = Exception("disk full")
@@ -14,6 +14,7 @@ from core.config import (
     PLATE_PATTERN,
     STATE_PATTERN,
     SEARCH_PLATE_PATTERN,
+    DECIMAL_PATTERN,
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
     TREE_ROW_HEIGHT,
@@ -121,6 +122,18 @@ class TestConfigPatterns(unittest.TestCase):
         for plate in invalid:
             assert not SEARCH_PLATE_PATTERN.fullmatch(plate), f"Pattern should not match {plate}"
 
+    def test_decimal_pattern_valid(self):
+        """Test decimal pattern matches finite decimal literals."""
+        valid = ["19", "19.99", "0.01", ".5", "5.", "-5.00", "+3", "1e2", "1.5E-3"]
+        for number in valid:
+            assert DECIMAL_PATTERN.fullmatch(number), f"Pattern should match {number}"
+
+    def test_decimal_pattern_rejects_non_finite(self):
+        """Test decimal pattern rejects inf/nan spellings and junk."""
+        invalid = ["nan", "NaN", "inf", "-inf", "infinity", "abc", "1.2.3", "e5", ".", ""]
+        for number in invalid:
+            assert not DECIMAL_PATTERN.fullmatch(number), f"Pattern should not match {number}"
+
 
 class TestConfigConstants(unittest.TestCase):
     """Test configuration constants."""
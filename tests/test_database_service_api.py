@@ -7,6 +7,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import os
+import shutil
 import sqlite3
 import tempfile
 import unittest
@@ -17,19 +18,37 @@ from data.database_service import DatabaseService
 
 
 class _DBTestCase(unittest.TestCase):
-    """Base class that sets up a fresh in-memory-style temp DB per test."""
+    """Base class that sets up a fresh in-memory-style temp DB per test.
+
+    The schema is built once per class into a template file; each test
+    starts from a byte copy of it so the DDL is not re-run every time.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls._template_dir = tempfile.TemporaryDirectory()
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        cls._template_path = os.path.join(cls._template_dir.name, f"template-{worker_id}.db")
+        DatabaseService(cls._template_path).close()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._template_dir.cleanup()
 
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test.db")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "test.db")
+        shutil.copyfile(self._template_path, self.db_path)
         self.db = DatabaseService(self.db_path)
         self._now = datetime.now().isoformat()
+        self._anchor_cache: dict[tuple[int, str], int] = {}
 
     def tearDown(self):
-        self.db.conn.close()
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        os.rmdir(self.temp_dir)
+        try:
+            self.db.conn.close()
+        except sqlite3.ProgrammingError:
+            pass
+        self.temp_dir.cleanup()
 
     # -- helpers --
     def _add_customer(self, name="Test Customer"):
@@ -46,14 +65,29 @@ class _DBTestCase(unittest.TestCase):
             start, end, active, None, self._now,
         )
 
+    def _anchor_invoice(self, contract_id, paid_at):
+        key = (contract_id, paid_at[:7])
+        inv_id = self._anchor_cache.get(key)
+        if inv_id is None:
+            inv_id = self.db.get_or_create_anchor_invoice(
+                contract_id, paid_at[:7], paid_at, self._now
+            )
+            self._anchor_cache[key] = inv_id
+        return inv_id
+
     def _add_payment(self, contract_id, amount, paid_at="2024-02-01"):
-        inv_id = self.db.get_or_create_anchor_invoice(
-            contract_id, paid_at[:7], paid_at, self._now
-        )
+        inv_id = self._anchor_invoice(contract_id, paid_at)
         self.db.create_payment(inv_id, paid_at, amount, "cash", "", "")
-        self.db.commit()
         return inv_id
 
+    def _add_payments(self, contract_id, payments):
+        """Record several ``(amount, paid_at)`` payments via ``create_payment``.
+
+        Call inside ``with self.db.conn:`` so the rows commit as one transaction.
+        """
+        for amount, paid_at in payments:
+            self._add_payment(contract_id, amount, paid_at)
+
 
 # ---------------------------------------------------------------------------
 # Customer CRUD
@@ -61,15 +95,15 @@ class _DBTestCase(unittest.TestCase):
 
 class TestCustomerCRUD(_DBTestCase):
     def test_create_and_get_customer(self):
-        cid = self._add_customer("Alice")
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer("Alice")
         row = self.db.get_customer_basic_by_id(cid)
         self.assertIsNotNone(row)
         self.assertEqual(row["name"], "Alice")
 
     def test_update_customer(self):
-        cid = self._add_customer("Alice")
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer("Alice")
         self.db.update_customer(cid, "Bob", "999", "NewCo", "note")
         self.db.commit()
         row = self.db.get_customer_basic_by_id(cid)
@@ -77,8 +111,8 @@ class TestCustomerCRUD(_DBTestCase):
         self.assertEqual(row["phone"], "999")
 
     def test_delete_customer(self):
-        cid = self._add_customer("Doomed")
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer("Doomed")
         self.db.delete_customer(cid)
         self.db.commit()
         row = self.db.get_customer_basic_by_id(cid)
@@ -100,16 +134,16 @@ class TestCustomerCRUD(_DBTestCase):
 
 class TestContractOperations(_DBTestCase):
     def test_create_contract(self):
-        cid = self._add_customer()
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer()
         ct_id = self._add_contract(cid, rate=750.0)
         self.db.commit()
         self.assertTrue(self.db.contract_exists(ct_id))
 
     def test_toggle_contract_active(self):
-        cid = self._add_customer()
-        ct_id = self._add_contract(cid)
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer()
+            ct_id = self._add_contract(cid)
         row = self.db.get_contract_active_row(ct_id)
         self.assertEqual(row["is_active"], 1)
 
@@ -122,20 +156,20 @@ class TestContractOperations(_DBTestCase):
         self.assertFalse(self.db.contract_exists(99999))
 
     def test_create_contract_rejects_truck_customer_mismatch(self):
-        customer1 = self._add_customer("Alice")
-        customer2 = self._add_customer("Bob")
-        truck_id = self._add_truck(customer1, "TX-777")
-        self.db.commit()
+        with self.db.conn:
+            customer1 = self._add_customer("Alice")
+            customer2 = self._add_customer("Bob")
+            truck_id = self._add_truck(customer1, "TX-777")
 
         with self.assertRaises(sqlite3.IntegrityError):
             self._add_contract(customer2, truck_id=truck_id)
 
     def test_update_contract_rejects_truck_customer_mismatch(self):
-        customer1 = self._add_customer("Alice")
-        customer2 = self._add_customer("Bob")
-        truck_id = self._add_truck(customer1, "TX-888")
-        contract_id = self._add_contract(customer1, truck_id=truck_id)
-        self.db.commit()
+        with self.db.conn:
+            customer1 = self._add_customer("Alice")
+            customer2 = self._add_customer("Bob")
+            truck_id = self._add_truck(customer1, "TX-888")
+            contract_id = self._add_contract(customer1, truck_id=truck_id)
 
         with self.assertRaises(sqlite3.IntegrityError):
             self.db.update_contract(
@@ -158,46 +192,45 @@ class TestContractOperations(_DBTestCase):
 
 class TestPaidTotals(_DBTestCase):
     def test_get_paid_total_for_contract_as_of(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
-        self._add_payment(ct, 200.0, "2024-02-01")
-        self._add_payment(ct, 300.0, "2024-03-01")
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
+            self._add_payments(ct, [(200.0, "2024-02-01"), (300.0, "2024-03-01")])
 
         total = self.db.get_paid_total_for_contract_as_of(ct, "2024-02-15")
-        self.assertAlmostEqual(total, 200.0)
+        self.assertEqual(total, 200.0)
 
         total_all = self.db.get_paid_total_for_contract_as_of(ct, "2024-12-31")
-        self.assertAlmostEqual(total_all, 500.0)
+        self.assertEqual(total_all, 500.0)
 
     def test_get_paid_total_for_contract_no_payments(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
         total = self.db.get_paid_total_for_contract_as_of(ct, "2024-12-31")
-        self.assertAlmostEqual(total, 0.0)
+        self.assertEqual(total, 0.0)
 
     def test_get_paid_totals_by_customer_as_of(self):
-        cid = self._add_customer()
-        ct1 = self._add_contract(cid, rate=100.0)
-        ct2 = self._add_contract(cid, rate=200.0)
-        self.db.commit()
-        self._add_payment(ct1, 50.0, "2024-01-15")
-        self._add_payment(ct2, 75.0, "2024-01-20")
+        with self.db.conn:
+            cid = self._add_customer()
+            ct1 = self._add_contract(cid, rate=100.0)
+            ct2 = self._add_contract(cid, rate=200.0)
+            self._add_payment(ct1, 50.0, "2024-01-15")
+            self._add_payment(ct2, 75.0, "2024-01-20")
 
         rows = self.db.get_paid_totals_by_customer_as_of(cid, "2024-01-31")
         paid_map = {int(r["contract_id"]): float(r["paid_total"]) for r in rows}
-        self.assertAlmostEqual(paid_map.get(ct1, 0), 50.0)
-        self.assertAlmostEqual(paid_map.get(ct2, 0), 75.0)
+        self.assertEqual(paid_map.get(ct1, 0), 50.0)
+        self.assertEqual(paid_map.get(ct2, 0), 75.0)
 
     def test_get_paid_totals_by_customer_excludes_other_customers(self):
-        c1 = self._add_customer("Alice")
-        c2 = self._add_customer("Bob")
-        ct1 = self._add_contract(c1)
-        ct2 = self._add_contract(c2)
-        self.db.commit()
-        self._add_payment(ct1, 100.0)
-        self._add_payment(ct2, 200.0)
+        with self.db.conn:
+            c1 = self._add_customer("Alice")
+            c2 = self._add_customer("Bob")
+            ct1 = self._add_contract(c1)
+            ct2 = self._add_contract(c2)
+            self._add_payment(ct1, 100.0)
+            self._add_payment(ct2, 200.0)
 
         rows = self.db.get_paid_totals_by_customer_as_of(c1, "2024-12-31")
         paid_map = {int(r["contract_id"]): float(r["paid_total"]) for r in rows}
@@ -205,54 +238,53 @@ class TestPaidTotals(_DBTestCase):
         self.assertNotIn(ct2, paid_map)
 
     def test_get_paid_totals_by_customer_empty(self):
-        cid = self._add_customer()
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer()
         rows = self.db.get_paid_totals_by_customer_as_of(cid, "2024-12-31")
         self.assertEqual(len(rows), 0)
 
     def test_get_paid_totals_by_contract_as_of(self):
-        c = self._add_customer()
-        ct = self._add_contract(c)
-        self.db.commit()
-        self._add_payment(ct, 300.0, "2024-03-01")
+        with self.db.conn:
+            c = self._add_customer()
+            ct = self._add_contract(c)
+            self._add_payment(ct, 300.0, "2024-03-01")
 
         rows = self.db.get_paid_totals_by_contract_as_of("2024-03-01")
         paid_map = {int(r["contract_id"]): float(r["paid_total"]) for r in rows}
-        self.assertAlmostEqual(paid_map.get(ct, 0), 300.0)
+        self.assertEqual(paid_map.get(ct, 0), 300.0)
 
     def test_get_paid_totals_by_contract_in_date_range(self):
-        c = self._add_customer()
-        ct = self._add_contract(c)
-        self.db.commit()
-        self._add_payment(ct, 120.0, "2024-03-01")
-        self._add_payment(ct, 80.0, "2024-03-15")
-        self._add_payment(ct, 50.0, "2024-04-01")
+        with self.db.conn:
+            c = self._add_customer()
+            ct = self._add_contract(c)
+            self._add_payments(
+                ct, [(120.0, "2024-03-01"), (80.0, "2024-03-15"), (50.0, "2024-04-01")]
+            )
 
         rows = self.db.get_paid_totals_by_contract_in_date_range("2024-03-01", "2024-03-31")
         paid_map = {int(r["contract_id"]): float(r["paid_total"]) for r in rows}
-        self.assertAlmostEqual(paid_map.get(ct, 0), 200.0)
+        self.assertEqual(paid_map.get(ct, 0), 200.0)
 
     def test_get_paid_totals_by_contract_in_date_range_empty(self):
-        c = self._add_customer()
-        ct = self._add_contract(c)
-        self.db.commit()
-        self._add_payment(ct, 120.0, "2024-03-01")
+        with self.db.conn:
+            c = self._add_customer()
+            ct = self._add_contract(c)
+            self._add_payment(ct, 120.0, "2024-03-01")
 
         rows = self.db.get_paid_totals_by_contract_in_date_range("2024-04-01", "2024-04-30")
         paid_map = {int(r["contract_id"]): float(r["paid_total"]) for r in rows}
-        self.assertAlmostEqual(paid_map.get(ct, 0), 0.0)
+        self.assertEqual(paid_map.get(ct, 0), 0.0)
 
     def test_as_of_date_filtering(self):
         """Payments after as_of date should not be included."""
-        c = self._add_customer()
-        ct = self._add_contract(c)
-        self.db.commit()
-        self._add_payment(ct, 100.0, "2024-01-15")
-        self._add_payment(ct, 100.0, "2024-06-15")
+        with self.db.conn:
+            c = self._add_customer()
+            ct = self._add_contract(c)
+            self._add_payments(ct, [(100.0, "2024-01-15"), (100.0, "2024-06-15")])
 
         rows = self.db.get_paid_totals_by_customer_as_of(c, "2024-03-01")
         paid_map = {int(r["contract_id"]): float(r["paid_total"]) for r in rows}
-        self.assertAlmostEqual(paid_map.get(ct, 0), 100.0)
+        self.assertEqual(paid_map.get(ct, 0), 100.0)
 
 
 # ---------------------------------------------------------------------------
@@ -261,25 +293,25 @@ class TestPaidTotals(_DBTestCase):
 
 class TestGetOrCreateAnchorInvoice(_DBTestCase):
     def test_creates_invoice_when_none_exist(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
         inv_id = self.db.get_or_create_anchor_invoice(ct, "2024-01", "2024-01-15", self._now)
         self.assertGreater(inv_id, 0)
 
     def test_returns_existing_invoice_for_same_month(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
         inv1 = self.db.get_or_create_anchor_invoice(ct, "2024-01", "2024-01-15", self._now)
         inv2 = self.db.get_or_create_anchor_invoice(ct, "2024-01", "2024-01-20", self._now)
         # Should reuse the same month invoice
         self.assertEqual(inv1, inv2)
 
     def test_creates_new_invoice_for_different_month(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
         inv1 = self.db.get_or_create_anchor_invoice(ct, "2024-01", "2024-01-15", self._now)
         inv2 = self.db.get_or_create_anchor_invoice(ct, "2024-02", "2024-02-15", self._now)
         self.assertNotEqual(inv1, inv2)
@@ -291,43 +323,42 @@ class TestGetOrCreateAnchorInvoice(_DBTestCase):
 
 class TestDeletePaymentsByContract(_DBTestCase):
     def test_deletes_all_payments_for_contract(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
-        self._add_payment(ct, 100.0, "2024-01-01")
-        self._add_payment(ct, 200.0, "2024-02-01")
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
+            self._add_payments(ct, [(100.0, "2024-01-01"), (200.0, "2024-02-01")])
 
         total_before = self.db.get_paid_total_for_contract_as_of(ct, "2024-12-31")
-        self.assertAlmostEqual(total_before, 300.0)
+        self.assertEqual(total_before, 300.0)
 
         self.db.delete_payments_by_contract(ct)
         self.db.commit()
 
         total_after = self.db.get_paid_total_for_contract_as_of(ct, "2024-12-31")
-        self.assertAlmostEqual(total_after, 0.0)
+        self.assertEqual(total_after, 0.0)
 
     def test_delete_payments_does_not_affect_other_contracts(self):
-        cid = self._add_customer()
-        ct1 = self._add_contract(cid, rate=100.0)
-        ct2 = self._add_contract(cid, rate=200.0)
-        self.db.commit()
-        self._add_payment(ct1, 50.0)
-        self._add_payment(ct2, 75.0)
+        with self.db.conn:
+            cid = self._add_customer()
+            ct1 = self._add_contract(cid, rate=100.0)
+            ct2 = self._add_contract(cid, rate=200.0)
+            self._add_payment(ct1, 50.0)
+            self._add_payment(ct2, 75.0)
 
         self.db.delete_payments_by_contract(ct1)
         self.db.commit()
 
-        self.assertAlmostEqual(
+        self.assertEqual(
             self.db.get_paid_total_for_contract_as_of(ct2, "2024-12-31"), 75.0
         )
 
 
 class TestDeleteTruckAtomicity(_DBTestCase):
     def test_delete_truck_rolls_back_if_second_delete_fails(self):
-        customer_id = self._add_customer()
-        truck_id = self._add_truck(customer_id, "TX-999")
-        contract_id = self._add_contract(customer_id, truck_id=truck_id)
-        self.db.commit()
+        with self.db.conn:
+            customer_id = self._add_customer()
+            truck_id = self._add_truck(customer_id, "TX-999")
+            contract_id = self._add_contract(customer_id, truck_id=truck_id)
 
         original_execute = self.db.execute
         call_count = {"value": 0}
@@ -355,18 +386,18 @@ class TestDeleteTruckAtomicity(_DBTestCase):
 
 class TestPaymentCountByContract(_DBTestCase):
     def test_count_with_payments(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
-        self._add_payment(ct, 100.0, "2024-01-01")
-        self._add_payment(ct, 100.0, "2024-02-01")
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
+            self._add_payment(ct, 100.0, "2024-01-01")
+            self._add_payment(ct, 100.0, "2024-02-01")
         count = self.db.get_payment_count_by_contract(ct)
         self.assertEqual(count, 2)
 
     def test_count_no_payments(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
         count = self.db.get_payment_count_by_contract(ct)
         self.assertEqual(count, 0)
 
@@ -377,11 +408,11 @@ class TestPaymentCountByContract(_DBTestCase):
 
 class TestRecentPaymentsForCustomer(_DBTestCase):
     def test_returns_payments_in_desc_order(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
-        self._add_payment(ct, 100.0, "2024-01-01")
-        self._add_payment(ct, 200.0, "2024-03-01")
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
+            self._add_payment(ct, 100.0, "2024-01-01")
+            self._add_payment(ct, 200.0, "2024-03-01")
 
         rows = self.db.get_recent_payments_for_customer(cid, limit=10)
         self.assertEqual(len(rows), 2)
@@ -389,17 +420,16 @@ class TestRecentPaymentsForCustomer(_DBTestCase):
         self.assertAlmostEqual(float(rows[1]["amount"]), 100.0)
 
     def test_respects_limit(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
-        for i in range(5):
-            self._add_payment(ct, 10.0 * (i + 1), f"2024-0{i + 1}-01")
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
+            self._add_payments(ct, [(10.0 * (i + 1), f"2024-0{i + 1}-01") for i in range(5)])
         rows = self.db.get_recent_payments_for_customer(cid, limit=2)
         self.assertEqual(len(rows), 2)
 
     def test_empty_for_no_payments(self):
-        cid = self._add_customer()
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer()
         rows = self.db.get_recent_payments_for_customer(cid, limit=5)
         self.assertEqual(len(rows), 0)
 
@@ -410,9 +440,9 @@ class TestRecentPaymentsForCustomer(_DBTestCase):
 
 class TestCustomerByContract(_DBTestCase):
     def test_get_customer_name_by_contract(self):
-        cid = self._add_customer("Alice")
-        ct = self._add_contract(cid)
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer("Alice")
+            ct = self._add_contract(cid)
         name = self.db.get_customer_name_by_contract(ct)
         self.assertEqual(name, "Alice")
 
@@ -421,9 +451,9 @@ class TestCustomerByContract(_DBTestCase):
         self.assertIsNone(name)
 
     def test_get_customer_id_by_contract(self):
-        cid = self._add_customer()
-        ct = self._add_contract(cid)
-        self.db.commit()
+        with self.db.conn:
+            cid = self._add_customer()
+            ct = self._add_contract(cid)
         result = self.db.get_customer_id_by_contract(ct)
         self.assertEqual(result, cid)
 
@@ -21,6 +21,11 @@ from unittest.mock import MagicMock, patch, PropertyMock
 from datetime import date
 
 
+def _bound(combo, evt):
+    """Return the callback *combo* bound to *evt*, or None."""
+    return next((c[0][1] for c in combo.bind.call_args_list if c[0][0] == evt), None)
+
+
 # ---------------------------------------------------------------------------
 # 1. validation.py — NaN / Infinity rejection
 # ---------------------------------------------------------------------------
@@ -80,11 +85,7 @@ class TestComboFocusOutRestoresValues(unittest.TestCase):
         make_searchable_combo(combo)
 
         # Get the _on_focus_out callback
-        focus_out_cb = None
-        for call in combo.bind.call_args_list:
-            if call[0][0] == "<FocusOut>":
-                focus_out_cb = call[0][1]
-                break
+        focus_out_cb = _bound(combo, "<FocusOut>")
 
         assert focus_out_cb is not None
 
@@ -111,11 +112,7 @@ class TestComboFocusOutRestoresValues(unittest.TestCase):
 
         make_searchable_combo(combo)
 
-        focus_out_cb = None
-        for call in combo.bind.call_args_list:
-            if call[0][0] == "<FocusOut>":
-                focus_out_cb = call[0][1]
-                break
+        focus_out_cb = _bound(combo, "<FocusOut>")
 
         combo._search_all_values = all_vals
         focus_out_cb(MagicMock())
@@ -150,28 +147,27 @@ class TestImportPreviewNoneCoercion(unittest.TestCase):
 class TestInvoiceFilenameSanitization(unittest.TestCase):
     """get_default_invoice_filename must strip filesystem-unsafe characters."""
 
-    @patch("invoicing.invoice_pdf.datetime")
-    def test_strips_slashes(self, mock_dt):
-        mock_dt.now.return_value.strftime.return_value = "20260227_120000"
+    def setUp(self):
+        patcher = patch("invoicing.invoice_pdf.datetime")
+        self.mock_dt = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_dt.now.return_value.strftime.return_value = "20260227_120000"
         from invoicing.invoice_pdf import get_default_invoice_filename
-        result = get_default_invoice_filename("Smith / Jones")
+        self.get_default_invoice_filename = get_default_invoice_filename
+
+    def test_strips_slashes(self):
+        result = self.get_default_invoice_filename("Smith / Jones")
         self.assertNotIn("/", result)
         self.assertIn("Smith", result)
         self.assertIn("Jones", result)
 
-    @patch("invoicing.invoice_pdf.datetime")
-    def test_strips_windows_unsafe_chars(self, mock_dt):
-        mock_dt.now.return_value.strftime.return_value = "20260227_120000"
-        from invoicing.invoice_pdf import get_default_invoice_filename
-        result = get_default_invoice_filename('A<B>C:D*E?F"G|H')
+    def test_strips_windows_unsafe_chars(self):
+        result = self.get_default_invoice_filename('A<B>C:D*E?F"G|H')
         for ch in r'\/:*?"<>|':
             self.assertNotIn(ch, result)
 
-    @patch("invoicing.invoice_pdf.datetime")
-    def test_normal_name_unchanged(self, mock_dt):
-        mock_dt.now.return_value.strftime.return_value = "20260227_120000"
-        from invoicing.invoice_pdf import get_default_invoice_filename
-        result = get_default_invoice_filename("Alice Smith")
+    def test_normal_name_unchanged(self):
+        result = self.get_default_invoice_filename("Alice Smith")
         self.assertEqual(result, "invoice_Alice_Smith_20260227_120000.pdf")
 
 
@@ -128,17 +128,17 @@ class TestNumericEdgeCases(unittest.TestCase):
 
     def test_float_infinity_string(self):
         """Test 'inf' or 'infinity' strings are rejected as non-numeric."""
-        with self.assertRaises(ValueError):
-            positive_float("Price", "inf")
-        with self.assertRaises(ValueError):
-            positive_float("Price", "infinity")
+        for value in ("inf", "infinity"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    positive_float("Price", value)
 
     def test_float_nan_string(self):
         """Test 'nan' strings are rejected as non-numeric."""
-        with self.assertRaises(ValueError):
-            positive_float("Price", "nan")
-        with self.assertRaises(ValueError):
-            positive_float("Price", "NaN")
+        for value in ("nan", "NaN"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    positive_float("Price", value)
 
 
 class TestBoundaryConditionEdgeCases(unittest.TestCase):
@@ -18,27 +18,68 @@ from core.error_handler import (
 )
 
 
+def _make_raiser(exc):
+    def raise_exception():
+        raise exc
+
+    return raise_exception
+
+
 class TestSafeUIActionDecorator(unittest.TestCase):
     """Test the @safe_ui_action decorator."""
 
-    def test_decorator_succeeds_on_normal_function(self):
-        """Test that decorator doesn't interfere with normal execution."""
+    @classmethod
+    def setUpClass(cls):
+        """Patch the error dialog and wrap the shared test functions once for the whole class."""
+        cls._patcher = patch("core.error_handler.messagebox.showerror")
+        cls.mock_show = cls._patcher.start()
 
         @safe_ui_action("Test Action")
         def normal_func(a, b):
             return a + b
 
-        result = normal_func(2, 3)
-        assert result == 5
-
-    def test_decorator_catches_exception(self):
-        """Test that decorator catches exceptions and returns None."""
-
         @safe_ui_action("Test Action", show_error_dialog=False)
         def failing_func():
             raise ValueError("Test error")
 
-        result = failing_func()
+        @safe_ui_action("Test Action")
+        def failing_func_with_dialog():
+            raise ValueError("Test error message")
+
+        @safe_ui_action("Test", show_error_dialog=False)
+        def complex_func(a, b, c=None, d=None):
+            return f"{a}-{b}-{c}-{d}"
+
+        @safe_ui_action("Test", show_error_dialog=False)
+        def raise_type_error():
+            return 1 + "string"
+
+        @safe_ui_action("Test", show_error_dialog=False)
+        def raise_keyboard_interrupt():
+            raise KeyboardInterrupt()
+
+        cls.normal_func = staticmethod(normal_func)
+        cls.failing_func = staticmethod(failing_func)
+        cls.failing_func_with_dialog = staticmethod(failing_func_with_dialog)
+        cls.complex_func = staticmethod(complex_func)
+        cls.raise_type_error = staticmethod(raise_type_error)
+        cls.raise_keyboard_interrupt = staticmethod(raise_keyboard_interrupt)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._patcher.stop()
+
+    def setUp(self):
+        self.mock_show.reset_mock()
+
+    def test_decorator_succeeds_on_normal_function(self):
+        """Test that decorator doesn't interfere with normal execution."""
+        result = self.normal_func(2, 3)
+        assert result == 5
+
+    def test_decorator_catches_exception(self):
+        """Test that decorator catches exceptions and returns None."""
+        result = self.failing_func()
         assert result is None
 
     def test_decorator_preserves_function_name(self):
@@ -52,58 +93,31 @@ class TestSafeUIActionDecorator(unittest.TestCase):
 
     def test_decorator_with_args_and_kwargs(self):
         """Test that decorator works with multiple arguments and keyword arguments."""
-
-        @safe_ui_action("Test", show_error_dialog=False)
-        def complex_func(a, b, c=None, d=None):
-            return f"{a}-{b}-{c}-{d}"
-
-        result = complex_func(1, 2, c=3, d=4)
+        result = self.complex_func(1, 2, c=3, d=4)
         assert result == "1-2-3-4"
 
     def test_decorator_catches_different_exception_types(self):
         """Test that decorator catches various exception types."""
-
-        @safe_ui_action("Test", show_error_dialog=False)
-        def raise_type_error():
-            return 1 + "string"
-
-        result = raise_type_error()
+        result = self.raise_type_error()
         assert result is None
 
-    @patch("core.error_handler.messagebox.showerror")
-    def test_decorator_shows_error_dialog_by_default(self, mock_show):
+    def test_decorator_shows_error_dialog_by_default(self):
         """Test that error dialog is shown by default."""
-
-        @safe_ui_action("Test Action")
-        def failing_func():
-            raise ValueError("Test error message")
-
-        failing_func()
-        mock_show.assert_called_once()
-        args = mock_show.call_args[0]
+        self.failing_func_with_dialog()
+        self.mock_show.assert_called_once()
+        args = self.mock_show.call_args[0]
         assert "Test Action" in args[0]
         assert "Test error message" in args[1]
 
-    @patch("core.error_handler.messagebox.showerror")
-    def test_decorator_respects_show_error_dialog_false(self, mock_show):
+    def test_decorator_respects_show_error_dialog_false(self):
         """Test that error dialog is not shown when show_error_dialog=False."""
-
-        @safe_ui_action("Test", show_error_dialog=False)
-        def failing_func():
-            raise ValueError("Test error")
-
-        failing_func()
-        mock_show.assert_not_called()
+        self.failing_func()
+        self.mock_show.assert_not_called()
 
     def test_decorator_does_not_catch_keyboard_interrupt(self):
         """Test that decorator lets KeyboardInterrupt propagate."""
-
-        @safe_ui_action("Test", show_error_dialog=False)
-        def raise_keyboard_interrupt():
-            raise KeyboardInterrupt()
-
         with self.assertRaises(KeyboardInterrupt):
-            raise_keyboard_interrupt()
+            self.raise_keyboard_interrupt()
 
 
 class TestSafeUIActionReturningDecorator(unittest.TestCase):
@@ -254,9 +268,11 @@ class TestLogException(unittest.TestCase):
 class TestErrorHandlingIntegration(unittest.TestCase):
     """Integration tests for error handling system."""
 
-    @patch("core.error_handler.messagebox.showerror")
-    def test_multiple_exception_types_handled(self, mock_show):
-        """Test that various exception types are handled gracefully."""
+    @classmethod
+    def setUpClass(cls):
+        """Patch the error dialog and wrap one raiser per exception type once for the whole class."""
+        cls._patcher = patch("core.error_handler.messagebox.showerror")
+        cls.mock_show = cls._patcher.start()
         test_exceptions = [
             ValueError("Value error"),
             TypeError("Type error"),
@@ -265,18 +281,26 @@ class TestErrorHandlingIntegration(unittest.TestCase):
             KeyError("Key error"),
             AttributeError("Attribute error"),
         ]
+        cls._wrapped = [
+            (exc, safe_ui_action("Test", show_error_dialog=True)(_make_raiser(exc)))
+            for exc in test_exceptions
+        ]
 
-        for exc in test_exceptions:
+    @classmethod
+    def tearDownClass(cls):
+        cls._patcher.stop()
 
-            @safe_ui_action("Test", show_error_dialog=True)
-            def raise_exception():
-                raise exc
+    def setUp(self):
+        self.mock_show.reset_mock()
 
+    def test_multiple_exception_types_handled(self):
+        """Test that various exception types are handled gracefully."""
+        for _exc, raise_exception in self._wrapped:
             result = raise_exception()
             assert result is None
 
             # Dialog should be called for each exception
-            assert mock_show.called
+            assert self.mock_show.called
 
     def test_decorator_chain_compatibility(self):
         """Test that decorator works well with other decorators."""
@@ -296,8 +320,7 @@ class TestErrorHandlingIntegration(unittest.TestCase):
         result = test_func(5)
         assert result == 5 + len("added")
 
-    @patch("core.error_handler.messagebox.showerror")
-    def test_error_handling_with_database_operations(self, mock_show):
+    def test_error_handling_with_database_operations(self):
         """Test error handling with database-like operations."""
 
         @safe_ui_action("Database Operation")
@@ -306,12 +329,11 @@ class TestErrorHandlingIntegration(unittest.TestCase):
 
         result = simulate_db_error()
         assert result is None
-        mock_show.assert_called_once()
-        error_title = mock_show.call_args[0][0]
+        self.mock_show.assert_called_once()
+        error_title = self.mock_show.call_args[0][0]
         assert "Database Operation" in error_title
 
-    @patch("core.error_handler.messagebox.showerror")
-    def test_error_handling_with_file_operations(self, mock_show):
+    def test_error_handling_with_file_operations(self):
         """Test error handling with file I/O-like operations."""
 
         @safe_ui_action("File Operation")
@@ -320,7 +342,7 @@ class TestErrorHandlingIntegration(unittest.TestCase):
 
         result = simulate_file_error()
         assert result is None
-        mock_show.assert_called_once()
+        self.mock_show.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Test script to verify the right-click fill payment form functionality"""
 
+_CURRENCY_TRIM = str.maketrans("", "", "$,")
+
 # Simulate the behavior of _sync_selected_invoice_to_payment_form
 def test_fill_payment_form():
     """Test that the form filling logic works correctly"""
@@ -50,7 +52,7 @@ def test_fill_payment_form():
                 continue
             
             # Extract balance
-            bal_str = str(values[9]).replace("$", "").replace(",", "").strip()
+            bal_str = str(values[9]).translate(_CURRENCY_TRIM).strip()
             
             try:
                 bal_num = float(bal_str)
@@ -53,6 +53,13 @@ class TestInvoiceGeneratorParseYmd(unittest.TestCase):
         result = _parse_ymd("2023-02-29")
         assert result is None
 
+    def test_parse_ymd_repeat_is_cached(self):
+        """Test repeated YMD strings are served from the parse cache."""
+        _parse_ymd.cache_clear()
+        first = _parse_ymd("2024-03-15")
+        assert _parse_ymd("2024-03-15") is first
+        assert _parse_ymd.cache_info().hits == 1
+
 
 class TestInvoiceGeneratorAddMonths(unittest.TestCase):
     """Test invoice generator month addition."""
@@ -103,6 +110,12 @@ class TestInvoiceGeneratorAddMonths(unittest.TestCase):
         result = _add_months(2024, 1, -1)
         assert result == (2023, 12)
 
+    def test_add_one_month_matches_general_path(self):
+        """Test the single-month fast path agrees with the general formula."""
+        for month in range(1, 13):
+            m = month + 1
+            assert _add_months(2024, month, 1) == (2024 + (m - 1) // 12, (m - 1) % 12 + 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,10 +8,11 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import copy
 import unittest
 from datetime import date
 from typing import Optional
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import Mock, patch, PropertyMock
 
 from invoicing.invoice_generator import (
     build_invoice_groups,
@@ -25,41 +26,50 @@ from invoicing.invoice_generator import (
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Stored as (key, value) pairs so dict() can build each row straight from it.
+_BASELINE_ROW_ITEMS = (
+    ("contract_id", 1),
+    ("customer_id", 100),
+    ("customer_name", "Alice"),
+    ("monthly_rate", 500.0),
+    ("start_date", "2024-01-15"),
+    ("end_date", ""),
+    ("plate", "TX-001"),
+)
+
+
 def _row(overrides: Optional[dict] = None) -> dict:
     """Return a minimal active-contract row dict, optionally overridden."""
-    base = {
-        "contract_id": 1,
-        "customer_id": 100,
-        "customer_name": "Alice",
-        "monthly_rate": 500.0,
-        "start_date": "2024-01-15",
-        "end_date": "",
-        "plate": "TX-001",
-    }
-    if overrides:
-        base.update(overrides)
-    return base
-
-
-def _make_db(**kwargs) -> MagicMock:
-    """Return a MagicMock DatabaseService with sensible defaults."""
-    db = MagicMock()
-    db.get_active_contracts_with_customer_plate_for_invoices.return_value = kwargs.get(
-        "invoice_rows", []
-    )
-    db.get_paid_total_for_contract_as_of.return_value = kwargs.get("paid_total", 0.0)
-    db.get_customer_basic_by_id.return_value = kwargs.get(
-        "customer_row", {"id": 100, "name": "Alice", "phone": "555", "company": "Co"}
-    )
-    db.get_active_contracts_for_customer_invoice.return_value = kwargs.get(
-        "customer_contracts", []
-    )
-    db.get_paid_totals_by_customer_as_of.return_value = kwargs.get(
-        "paid_by_customer", []
-    )
-    db.get_recent_payments_for_customer.return_value = kwargs.get(
-        "recent_payments", []
-    )
+    return dict(_BASELINE_ROW_ITEMS, **(overrides or {}))
+
+
+# Maps each _make_db() keyword to the DatabaseService method it configures,
+# along with that method's default return value.
+_DB_DEFAULTS = {
+    "invoice_rows": ("get_active_contracts_with_customer_plate_for_invoices", []),
+    "paid_total": ("get_paid_total_for_contract_as_of", 0.0),
+    "customer_row": (
+        "get_customer_basic_by_id",
+        {"id": 100, "name": "Alice", "phone": "555", "company": "Co"},
+    ),
+    "customer_contracts": ("get_active_contracts_for_customer_invoice", []),
+    "paid_by_customer": ("get_paid_totals_by_customer_as_of", []),
+    "recent_payments": ("get_recent_payments_for_customer", []),
+}
+_DB_METHODS = [method for method, _default in _DB_DEFAULTS.values()]
+
+
+def _make_db(**kwargs) -> Mock:
+    """Return a Mock DatabaseService with sensible defaults.
+
+    ``spec_set`` limits the mock to the methods the invoice builders use,
+    which is cheaper to construct than a bare MagicMock and rejects typos.
+    """
+    db = Mock(spec_set=_DB_METHODS)
+    db.configure_mock(**{
+        f"{method}.return_value": kwargs[key] if key in kwargs else copy.copy(default)
+        for key, (method, default) in _DB_DEFAULTS.items()
+    })
     return db
 
 
@@ -4,7 +4,9 @@
 import sys
 from pathlib import Path
 from datetime import date
-import time
+import inspect
+import os
+import timeit
 
 # Add parent directory to path so imports work
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -24,144 +26,134 @@ from utils.billing_date_utils import (
 )
 
 
-class TestPerformanceValidation(unittest.TestCase):
-    """Performance tests for validation functions."""
+# Per-call budgets carried over from the old "N calls in under 1 second" checks.
+# Slow CI hosts can raise them without editing the tests.
+_VALIDATION_BUDGET_NS = int(os.getenv("CHANGSHENG_PERF_VALIDATION_BUDGET_NS", "300000"))
+_DATE_BUDGET_NS = int(os.getenv("CHANGSHENG_PERF_DATE_BUDGET_NS", "25000"))
 
-    def test_performance_normalize_whitespace_bulk(self):
-        """Test performance of bulk whitespace normalization."""
-        test_strings = [
-            "  hello   world  " * 100,
-            "a b c d e f g h" * 50,
-            "\t\n  mixed  whitespace  \n\t" * 100,
-        ]
 
-        start = time.time()
-        for _ in range(1000):
-            for s in test_strings:
-                normalize_whitespace(s)
-        elapsed = time.time() - start
-
-        # Should complete 3000 operations in under 1 second
-        assert elapsed < 1.0, f"Whitespace normalization too slow: {elapsed}s"
-
-    def test_performance_required_text_validation(self):
-        """Test performance of text validation."""
-        test_cases = [
-            ("Field", "Simple text"),
-            ("Field", "Text with spaces   and   tabs"),
-            ("Field", "Special chars !@#$%^&*()"),
-        ]
+# Benchmark fixtures, built once per process rather than on every test call.
+_WS_FIXTURES = (
+    "  hello   world  " * 100,
+    "a b c d e f g h" * 50,
+    "\t\n  mixed  whitespace  \n\t" * 100,
+)
+_TEXT_FIXTURES = (
+    "Simple text",
+    "Text with spaces   and   tabs",
+    "Special chars !@#$%^&*()",
+)
+_FLOAT_FIXTURES = ("1234.56", "$1,234.56", "9999.99", "0.01")
+_PLATE_FIXTURES = ("ABC-1234", "TX-XYZ-999", "ABCDEFGH")
+_ADD_MONTHS_FIXTURES = ((2024, 1, 6), (2024, 6, -3), (2024, 12, 1), (2024, 1, 36))
+_ELAPSED_START = date(2024, 1, 15)
+_ELAPSED_END_FIXTURES = (date(2024, 1, 15), date(2024, 6, 15), date(2025, 1, 15))
+_YMD_FIXTURES = ("2024-01-15", "2024-06-30", "2024-12-31")
+_YM_FIXTURES = ("2024-01", "2024-06", "2024-12")
+_LONG_TEXT_10K = "A" * 10000
+
+# The validators are memoized, and autorange replays the same fixtures, so
+# timing the public names would only measure cache hits. Benchmark the
+# undecorated functions instead.
+_bench_normalize_whitespace = inspect.unwrap(normalize_whitespace)
+_bench_required_text = inspect.unwrap(required_text)
+_bench_positive_float = inspect.unwrap(positive_float)
+_bench_required_plate = inspect.unwrap(required_plate)
 
-        start = time.time()
-        for _ in range(1000):
-            for label, value in test_cases:
-                required_text(label, value)
-        elapsed = time.time() - start
-
-        assert elapsed < 1.0, f"Text validation too slow: {elapsed}s"
-
-    def test_performance_positive_float_parsing(self):
-        """Test performance of float parsing."""
-        test_cases = [
-            "1234.56",
-            "$1,234.56",
-            "9999.99",
-            "0.01",
-        ]
 
-        start = time.time()
-        for _ in range(1000):
-            for value in test_cases:
-                positive_float("Price", value)
-        elapsed = time.time() - start
+def _bench_ns_per_op(fn, ops_per_call):
+    """Return nanoseconds per operation for ``fn()``, timed with ``autorange``.
 
-        assert elapsed < 1.0, f"Float parsing too slow: {elapsed}s"
+    ``Timer.autorange`` picks a loop count that runs for at least 0.2 s, so
+    fast and slow functions are sampled equally well; timeit also pauses the
+    garbage collector while timing.
+    """
+    number, elapsed = timeit.Timer(fn).autorange()
+    return elapsed * 1e9 / (number * ops_per_call)
+
+
+class _PerfTestCase(unittest.TestCase):
+    """Calibrates the host's bare call overhead once per class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._call_overhead_ns = _bench_ns_per_op(lambda: None, 1)
+
+    def assertWithinBudget(self, ns_per_op, budget_ns, label):
+        """Fail if *ns_per_op* exceeds *budget_ns* plus twice the call overhead."""
+        limit = budget_ns + 2 * self._call_overhead_ns
+        self.assertLess(ns_per_op, limit, f"{label} too slow: {ns_per_op:.0f} ns/op")
+
+
+class TestPerformanceValidation(_PerfTestCase):
+    """Performance tests for validation functions."""
 
-    def test_performance_plate_validation(self):
-        """Test performance of plate validation."""
-        test_cases = [
-            "ABC-1234",
-            "TX-XYZ-999",
-            "ABCDEFGH",
+    def test_performance_validators_bulk(self):
+        """Test per-call performance of each validator over its fixtures."""
+        cases = [
+            ("Whitespace normalization", _bench_normalize_whitespace, _WS_FIXTURES),
+            ("Text validation", lambda value: _bench_required_text("Field", value), _TEXT_FIXTURES),
+            ("Float parsing", lambda value: _bench_positive_float("Price", value), _FLOAT_FIXTURES),
+            ("Plate validation", _bench_required_plate, _PLATE_FIXTURES),
         ]
 
-        start = time.time()
-        for _ in range(1000):
-            for plate in test_cases:
-                required_plate(plate)
-        elapsed = time.time() - start
+        for name, validator, values in cases:
+            with self.subTest(name=name):
+                def run():
+                    for value in values:
+                        validator(value)
 
-        assert elapsed < 1.0, f"Plate validation too slow: {elapsed}s"
+                ns_per_op = _bench_ns_per_op(run, len(values))
+                self.assertWithinBudget(ns_per_op, _VALIDATION_BUDGET_NS, name)
 
 
-class TestPerformanceDateFunctions(unittest.TestCase):
+class TestPerformanceDateFunctions(_PerfTestCase):
     """Performance tests for date functions."""
 
     def test_performance_add_months_bulk(self):
         """Test performance of bulk month addition."""
-        test_cases = [
-            (2024, 1, 6),
-            (2024, 6, -3),
-            (2024, 12, 1),
-            (2024, 1, 36),
-        ]
-
-        start = time.time()
-        for _ in range(10000):
-            for y, m, delta in test_cases:
+        def run():
+            for y, m, delta in _ADD_MONTHS_FIXTURES:
                 add_months(y, m, delta)
-        elapsed = time.time() - start
 
-        assert elapsed < 1.0, f"Month addition too slow: {elapsed}s"
+        ns_per_op = _bench_ns_per_op(run, len(_ADD_MONTHS_FIXTURES))
+        self.assertWithinBudget(ns_per_op, _DATE_BUDGET_NS, "Month addition")
+
+    def test_add_months_matches_month_index_reference(self):
+        """Bulk add_months results match divmod over an absolute month index."""
+        for year in range(1999, 2031):
+            for month in range(1, 13):
+                for delta in range(-60, 61):
+                    expected_year, month_index = divmod(year * 12 + month - 1 + delta, 12)
+                    assert add_months(year, month, delta) == (expected_year, month_index + 1), \
+                        f"add_months({year}, {month}, {delta})"
 
     def test_performance_elapsed_months_bulk(self):
         """Test performance of bulk elapsed months calculation."""
-        start_d = date(2024, 1, 15)
-        end_dates = [
-            date(2024, 1, 15),
-            date(2024, 6, 15),
-            date(2025, 1, 15),
-        ]
+        def run():
+            for end_d in _ELAPSED_END_FIXTURES:
+                elapsed_months_inclusive(_ELAPSED_START, end_d)
 
-        start = time.time()
-        for _ in range(10000):
-            for end_d in end_dates:
-                elapsed_months_inclusive(start_d, end_d)
-        elapsed = time.time() - start
-
-        assert elapsed < 1.0, f"Elapsed months too slow: {elapsed}s"
+        ns_per_op = _bench_ns_per_op(run, len(_ELAPSED_END_FIXTURES))
+        self.assertWithinBudget(ns_per_op, _DATE_BUDGET_NS, "Elapsed months")
 
     def test_performance_parse_ymd_bulk(self):
         """Test performance of bulk YMD parsing."""
-        test_dates = [
-            "2024-01-15",
-            "2024-06-30",
-            "2024-12-31",
-        ]
-
-        start = time.time()
-        for _ in range(10000):
-            for d in test_dates:
+        def run():
+            for d in _YMD_FIXTURES:
                 parse_ymd(d)
-        elapsed = time.time() - start
 
-        assert elapsed < 1.0, f"YMD parsing too slow: {elapsed}s"
+        ns_per_op = _bench_ns_per_op(run, len(_YMD_FIXTURES))
+        self.assertWithinBudget(ns_per_op, _DATE_BUDGET_NS, "YMD parsing")
 
     def test_performance_parse_ym_bulk(self):
         """Test performance of bulk YM parsing."""
-        test_months = [
-            "2024-01",
-            "2024-06",
-            "2024-12",
-        ]
-
-        start = time.time()
-        for _ in range(10000):
-            for m in test_months:
+        def run():
+            for m in _YM_FIXTURES:
                 parse_ym(m)
-        elapsed = time.time() - start
 
-        assert elapsed < 1.0, f"YM parsing too slow: {elapsed}s"
+        ns_per_op = _bench_ns_per_op(run, len(_YM_FIXTURES))
+        self.assertWithinBudget(ns_per_op, _DATE_BUDGET_NS, "YM parsing")
 
 
 class TestStressExtremeCases(unittest.TestCase):
@@ -169,12 +161,9 @@ class TestStressExtremeCases(unittest.TestCase):
 
     def test_stress_very_long_text_fields(self):
         """Test validation with extremely long text."""
-        # 10,000 character string
-        long_text = "A" * 10000
-        
-        # With reasonable max length, should raise
+        # With reasonable max length, a 10,000 character string should raise
         with self.assertRaises(ValueError):
-            required_text("Field", long_text, max_len=1000)
+            required_text("Field", _LONG_TEXT_10K, max_len=1000)
 
     def test_stress_many_months_addition(self):
         """Test adding very large number of months."""
@@ -217,14 +206,10 @@ class TestConsistency(unittest.TestCase):
 
     def test_consistency_multiple_normalizations(self):
         """Test that multiple normalizations are idempotent."""
-        text = "  hello   world  "
-        
-        norm1 = normalize_whitespace(text)
-        norm2 = normalize_whitespace(norm1)
-        norm3 = normalize_whitespace(norm2)
-        
-        # All should be identical
-        assert norm1 == norm2 == norm3
+        normalized = normalize_whitespace("  hello   world  ")
+
+        self.assertEqual(normalized, "hello world")
+        self.assertEqual(normalize_whitespace(normalized), normalized)
 
     def test_consistency_plate_uppercase_normalization(self):
         """Test that plate normalization is consistent."""
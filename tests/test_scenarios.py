@@ -8,7 +8,9 @@ from datetime import date, datetime, timedelta
 # Add parent directory to path so imports work
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import operator
 import unittest
+from functools import lru_cache
 from utils.billing_date_utils import (
     parse_ymd,
     parse_ym,
@@ -24,6 +26,11 @@ from utils.validation import (
     positive_int,
 )
 
+# The scenarios reparse the same handful of date strings; memoize locally so
+# repeated constants skip strptime without changing the production parsers.
+_parse_ymd_cached = lru_cache(maxsize=64)(parse_ymd)
+_parse_ym_cached = lru_cache(maxsize=64)(parse_ym)
+
 
 class TestScenarioCustomerValidation(unittest.TestCase):
     """Integration tests for customer validation scenarios."""
@@ -97,16 +104,16 @@ class TestScenarioContractBilling(unittest.TestCase):
 
     def test_scenario_contract_duration_months(self):
         """Test scenario: calculating contract duration in months."""
-        start = parse_ymd("2024-01-15")
-        end = parse_ymd("2024-06-15")
+        start = _parse_ymd_cached("2024-01-15")
+        end = _parse_ymd_cached("2024-06-15")
         
         duration = elapsed_months_inclusive(start, end)
         assert duration == 6
 
     def test_scenario_contract_extends_beyond_year(self):
         """Test scenario: contract extends beyond year boundary."""
-        start = parse_ymd("2024-11-01")
-        end = parse_ymd("2025-02-28")
+        start = _parse_ymd_cached("2024-11-01")
+        end = _parse_ymd_cached("2025-02-28")
         
         duration = elapsed_months_inclusive(start, end)
         assert duration == 4
@@ -114,11 +121,11 @@ class TestScenarioContractBilling(unittest.TestCase):
     def test_scenario_next_billing_date(self):
         """Test scenario: calculating next billing date."""
         # If contract started 2024-01-15, what's next due date?
-        start = parse_ym("2024-01")
+        start = _parse_ym_cached("2024-01")
         today_ym = ym(date.today())
         
         # Parse current month
-        current_year, current_month = parse_ym(today_ym)
+        current_year, current_month = _parse_ym_cached(today_ym)
         assert current_year is not None
         assert current_month is not None
 
@@ -129,12 +136,12 @@ class TestScenarioInvoicing(unittest.TestCase):
     def test_scenario_invoice_period_march(self):
         """Test scenario: generating invoice for March."""
         # Parse the period
-        period = parse_ym("2024-03")
+        period = _parse_ym_cached("2024-03")
         assert period == (2024, 3)
 
         # Contract running for multiple months
-        start = parse_ymd("2024-01-15")
-        date_in_march = parse_ymd("2024-03-15")
+        start = _parse_ymd_cached("2024-01-15")
+        date_in_march = _parse_ymd_cached("2024-03-15")
         
         months = elapsed_months_inclusive(start, date_in_march)
         assert months == 3
@@ -142,15 +149,15 @@ class TestScenarioInvoicing(unittest.TestCase):
     def test_scenario_invoice_multiple_contracts(self):
         """Test scenario: invoice with multiple contracts."""
         # Contract 1: started Jan
-        contract1_start = parse_ymd("2024-01-01")
+        contract1_start = _parse_ymd_cached("2024-01-01")
         contract1_rate = positive_float("Rate", "1000.00")
         
         # Contract 2: started Feb
-        contract2_start = parse_ymd("2024-02-01")
+        contract2_start = _parse_ymd_cached("2024-02-01")
         contract2_rate = positive_float("Rate", "1500.00")
         
         # Both active as of March
-        as_of_date = parse_ymd("2024-03-15")
+        as_of_date = _parse_ymd_cached("2024-03-15")
         
         c1_months = elapsed_months_inclusive(contract1_start, as_of_date)
         c2_months = elapsed_months_inclusive(contract2_start, as_of_date)
@@ -164,8 +171,8 @@ class TestScenarioInvoicing(unittest.TestCase):
     def test_scenario_invoice_year_boundary(self):
         """Test scenario: invoice at year boundary."""
         # Contract from Nov 2023 to Feb 2024
-        start = parse_ymd("2023-11-15")
-        as_of = parse_ymd("2024-02-15")
+        start = _parse_ymd_cached("2023-11-15")
+        as_of = _parse_ymd_cached("2024-02-15")
         
         months = elapsed_months_inclusive(start, as_of)
         # Nov, Dec, Jan, Feb = 4 months
@@ -189,7 +196,7 @@ class TestScenarioBillingCalculations(unittest.TestCase):
 
         months_each = [3, 3, 2, 6, 4, 5]
 
-        total_owed = sum(rate * months for rate, months in zip(rates, months_each))
+        total_owed = sum(map(operator.mul, rates, months_each))
         
         expected = (
             1000 * 3 +  # 3000
@@ -230,8 +237,8 @@ class TestScenarioDateRanges(unittest.TestCase):
         fiscal_start_ym = "2024-04"
         fiscal_end_ym = "2025-03"
 
-        start_yr, start_mo = parse_ym(fiscal_start_ym)
-        end_yr, end_mo = parse_ym(fiscal_end_ym)
+        start_yr, start_mo = _parse_ym_cached(fiscal_start_ym)
+        end_yr, end_mo = _parse_ym_cached(fiscal_end_ym)
 
         assert (start_yr, start_mo) == (2024, 4)
         assert (end_yr, end_mo) == (2025, 3)
@@ -243,7 +250,7 @@ class TestScenarioDateRanges(unittest.TestCase):
     def test_scenario_month_navigation(self):
         """Test scenario: navigating months forward and backward."""
         current = "2024-06"  # June 2024
-        current_yr, current_mo = parse_ym(current)
+        current_yr, current_mo = _parse_ym_cached(current)
 
         # Next month
         next_yr, next_mo = add_months(current_yr, current_mo, 1)
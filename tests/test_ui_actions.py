@@ -16,6 +16,13 @@ from utils.validation import (
 )
 
 
+# Accepted input formats, shared by the format-loop tests below.
+_PAYMENT_FORMATS = ("100.00", "$100.00", "100", "$100", "$1,000.00")
+_PHONE_FORMATS = ("555-123-4567", "(555) 123-4567", "5551234567", "555.123.4567")
+_PLATE_FORMATS = ("ABC-1234", "ABC 1234", "ABCDEFGH")
+_CURRENCY_FORMATS = ("100", "100.00", "$100", "$100.00", "$1,000", "$1,000.00")
+
+
 class TestUiActionsCustomerValidation(unittest.TestCase):
     """Test validation logic used in UI actions."""
 
@@ -109,16 +116,10 @@ class TestUiActionsPaymentValidation(unittest.TestCase):
 
     def test_validate_payment_currency_format(self):
         """Test various currency formats."""
-        formats = [
-            "100.00",
-            "$100.00",
-            "100",
-            "$100",
-            "$1,000.00",
-        ]
-        for fmt in formats:
-            result = positive_float("Amount", fmt)
-            assert result > 0
+        for fmt in _PAYMENT_FORMATS:
+            with self.subTest(fmt=fmt):
+                result = positive_float("Amount", fmt)
+                assert result > 0
 
 
 class TestUiActionsFormValidation(unittest.TestCase):
@@ -164,18 +165,13 @@ class TestUiActionsErrorHandling(unittest.TestCase):
 
     def test_validation_error_message_readable(self):
         """Test that error messages are readable."""
-        try:
+        with self.assertRaisesRegex(ValueError, r"(?i)required"):
             required_text("Customer Name", "")
-        except ValueError as e:
-            assert "required" in str(e).lower()
 
     def test_validation_provides_field_context(self):
         """Test that error includes field name."""
-        try:
+        with self.assertRaisesRegex(ValueError, r"(?i)rate|greater than 0"):
             positive_float("Monthly Rate", "-100")
-        except ValueError as e:
-            error_msg = str(e).lower()
-            assert "rate" in error_msg or "greater than 0" in error_msg
 
     def test_multiple_validation_errors(self):
         """Test handling multiple validation errors."""
@@ -199,40 +195,24 @@ class TestUiActionsDataFormats(unittest.TestCase):
 
     def test_phone_formats(self):
         """Test various phone formats are accepted."""
-        formats = [
-            "555-123-4567",
-            "(555) 123-4567",
-            "5551234567",
-            "555.123.4567",
-        ]
-        for fmt in formats:
-            result = optional_phone(fmt)
-            assert result is not None
+        for fmt in _PHONE_FORMATS:
+            with self.subTest(fmt=fmt):
+                result = optional_phone(fmt)
+                assert result is not None
 
     def test_plate_formats(self):
         """Test various plate formats."""
-        plates = [
-            "ABC-1234",
-            "ABC 1234",
-            "ABCDEFGH",
-        ]
-        for plate in plates:
-            result = required_plate(plate)
-            assert result is not None
+        for plate in _PLATE_FORMATS:
+            with self.subTest(plate=plate):
+                result = required_plate(plate)
+                assert result is not None
 
     def test_currency_formats(self):
         """Test various currency formats."""
-        amounts = [
-            "100",
-            "100.00",
-            "$100",
-            "$100.00",
-            "$1,000",
-            "$1,000.00",
-        ]
-        for amount in amounts:
-            result = positive_float("Amount", amount)
-            assert result > 0
+        for amount in _CURRENCY_FORMATS:
+            with self.subTest(amount=amount):
+                result = positive_float("Amount", amount)
+                assert result > 0
 
     def test_whitespace_handling(self):
         """Test whitespace handling in validation."""
@@ -4,6 +4,7 @@
 import sys
 from datetime import date
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 # Add parent directory to path so imports work
@@ -18,7 +19,19 @@ from ui.ui_actions import (
 )
 
 
+# Tree row values: (truck_id, plate, state) for trucks; invoice rows are the
+# 10-column parent/child layout of the invoices tree.
+_TRUCK_ROW = ("12", "TX-ABC-123", "TX")
+_TRUCK_ROW_NO_PLATE = ("12", "")
+_TRUCK_ROW_NO_CONTRACT = ("99", "TX-NA")
+_INVOICE_PARENT_ROW = ("", "Acme Inc") + ("",) * 8
+_INVOICE_PLATE_ROW = ("123", "", "PLATE-1", "$100.00") + ("",) * 5 + ("$10.00",)
+_INVOICE_CUSTOMER_LEVEL_ROW = ("321", "", "", "$100.00") + ("",) * 5 + ("$10.00",)
+
+
 class _MockEntry:
+    __slots__ = ("_value",)
+
     def __init__(self, value: str):
         self._value = value
 
@@ -26,19 +39,50 @@ class _MockEntry:
         return self._value
 
 
-class TestRecordPaymentForSelectedTruckEdgeCases(unittest.TestCase):
-    def test_uses_selected_row_plate_label(self):
-        app = MagicMock()
-        app.truck_tree.selection.return_value = ["row1"]
-        app.truck_tree.item.return_value = ("12", "TX-ABC-123", "TX")
+class _MockTree:
+    """Treeview stand-in with a fixed selection and row values."""
+
+    __slots__ = ("_selection", "_values")
+
+    def __init__(self, selection, values):
+        self._selection = selection
+        self._values = values
+
+    def selection(self):
+        return self._selection
+
+    def item(self, _iid, _option=None):
+        return self._values
 
-        db = MagicMock()
-        db.get_preferred_contract_for_truck.return_value = {
-            "contract_id": 42,
-            "plate": "TX-ABC-123",
-        }
 
-        open_form = MagicMock()
+class _CallRecorder:
+    """Callback stand-in that records the positional args of each call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args):
+        self.calls.append(args)
+
+
+def _truck_db(contract_row):
+    return SimpleNamespace(get_preferred_contract_for_truck=lambda _truck_id: contract_row)
+
+
+class _ShowInfoPatchedTestCase(unittest.TestCase):
+    """Patches messagebox.showinfo once per test for the whole class."""
+
+    def setUp(self):
+        patcher = patch("ui.ui_actions.messagebox.showinfo")
+        self.mock_info = patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestRecordPaymentForSelectedTruckEdgeCases(_ShowInfoPatchedTestCase):
+    def test_uses_selected_row_plate_label(self):
+        app = SimpleNamespace(truck_tree=_MockTree(["row1"], _TRUCK_ROW))
+        db = _truck_db({"contract_id": 42, "plate": "TX-ABC-123"})
+        open_form = _CallRecorder()
 
         record_payment_for_selected_truck_action(
             app=app,
@@ -46,20 +90,12 @@ class TestRecordPaymentForSelectedTruckEdgeCases(unittest.TestCase):
             open_payment_form_for_contract_cb=open_form,
         )
 
-        open_form.assert_called_once_with(42, "TX-ABC-123", None)
+        self.assertEqual(open_form.calls, [(42, "TX-ABC-123", None)])
 
     def test_falls_back_to_contract_plate_when_row_plate_missing(self):
-        app = MagicMock()
-        app.truck_tree.selection.return_value = ["row1"]
-        app.truck_tree.item.return_value = ("12", "")
-
-        db = MagicMock()
-        db.get_preferred_contract_for_truck.return_value = {
-            "contract_id": 77,
-            "plate": "CA-999",
-        }
-
-        open_form = MagicMock()
+        app = SimpleNamespace(truck_tree=_MockTree(["row1"], _TRUCK_ROW_NO_PLATE))
+        db = _truck_db({"contract_id": 77, "plate": "CA-999"})
+        open_form = _CallRecorder()
 
         record_payment_for_selected_truck_action(
             app=app,
@@ -67,18 +103,12 @@ class TestRecordPaymentForSelectedTruckEdgeCases(unittest.TestCase):
             open_payment_form_for_contract_cb=open_form,
         )
 
-        open_form.assert_called_once_with(77, "CA-999", None)
-
-    @patch("ui.ui_actions.messagebox.showinfo")
-    def test_no_contract_shows_info_and_does_not_open_form(self, mock_info):
-        app = MagicMock()
-        app.truck_tree.selection.return_value = ["row1"]
-        app.truck_tree.item.return_value = ("99", "TX-NA")
+        self.assertEqual(open_form.calls, [(77, "CA-999", None)])
 
-        db = MagicMock()
-        db.get_preferred_contract_for_truck.return_value = None
-
-        open_form = MagicMock()
+    def test_no_contract_shows_info_and_does_not_open_form(self):
+        app = SimpleNamespace(truck_tree=_MockTree(["row1"], _TRUCK_ROW_NO_CONTRACT))
+        db = _truck_db(None)
+        open_form = _CallRecorder()
 
         record_payment_for_selected_truck_action(
             app=app,
@@ -86,62 +116,56 @@ class TestRecordPaymentForSelectedTruckEdgeCases(unittest.TestCase):
             open_payment_form_for_contract_cb=open_form,
         )
 
-        open_form.assert_not_called()
-        mock_info.assert_called_once()
+        self.assertEqual(open_form.calls, [])
+        self.mock_info.assert_called_once()
 
 
-class TestOpenPaymentFormWindowEdgeCases(unittest.TestCase):
-    @patch("ui.ui_actions.messagebox.showinfo")
-    def test_parent_row_rejected_when_contract_id_not_numeric(self, mock_info):
-        app = MagicMock()
-        app.invoice_tree.selection.return_value = ["parent"]
-        app.invoice_tree.item.return_value = ("", "Acme Inc", "", "", "", "", "", "", "", "")
-        app.invoice_date = _MockEntry("2026-02-01")
-
-        open_form = MagicMock()
+class TestOpenPaymentFormWindowEdgeCases(_ShowInfoPatchedTestCase):
+    def test_parent_row_rejected_when_contract_id_not_numeric(self):
+        app = SimpleNamespace(
+            invoice_tree=_MockTree(["parent"], _INVOICE_PARENT_ROW),
+            invoice_date=_MockEntry("2026-02-01"),
+        )
+        open_form = _CallRecorder()
 
         open_payment_form_window_action(
             app=app,
             open_payment_form_for_contract_cb=open_form,
         )
 
-        open_form.assert_not_called()
-        mock_info.assert_called_once()
+        self.assertEqual(open_form.calls, [])
+        self.mock_info.assert_called_once()
 
     def test_passes_none_as_of_when_invoice_date_invalid(self):
-        app = MagicMock()
-        app.invoice_tree.selection.return_value = ["child"]
-        app.invoice_tree.item.return_value = ("123", "", "PLATE-1", "$100.00", "", "", "", "", "", "$10.00")
-        app.invoice_date = _MockEntry("not-a-date")
-
-        open_form = MagicMock()
+        app = SimpleNamespace(
+            invoice_tree=_MockTree(["child"], _INVOICE_PLATE_ROW),
+            invoice_date=_MockEntry("not-a-date"),
+        )
+        open_form = _CallRecorder()
 
         open_payment_form_window_action(
             app=app,
             open_payment_form_for_contract_cb=open_form,
         )
 
-        args = open_form.call_args[0]
-        self.assertEqual(args[0], 123)
-        self.assertEqual(args[1], "PLATE-1")
-        self.assertIsNone(args[2])
+        self.assertEqual(open_form.calls, [(123, "PLATE-1", None)])
 
     def test_defaults_to_customer_level_when_scope_empty(self):
-        app = MagicMock()
-        app.invoice_tree.selection.return_value = ["child"]
-        app.invoice_tree.item.return_value = ("321", "", "", "$100.00", "", "", "", "", "", "$10.00")
-        app.invoice_date = _MockEntry("2026-02-01")
-
-        open_form = MagicMock()
+        app = SimpleNamespace(
+            invoice_tree=_MockTree(["child"], _INVOICE_CUSTOMER_LEVEL_ROW),
+            invoice_date=_MockEntry("2026-02-01"),
+        )
+        open_form = _CallRecorder()
 
         open_payment_form_window_action(
             app=app,
             open_payment_form_for_contract_cb=open_form,
         )
 
-        args = open_form.call_args[0]
-        self.assertEqual(args[0], 321)
-        self.assertEqual(args[1], "(customer-level)")
+        self.assertEqual(len(open_form.calls), 1)
+        contract_id, plate_label, _as_of = open_form.calls[0]
+        self.assertEqual(contract_id, 321)
+        self.assertEqual(plate_label, "(customer-level)")
 
 
 class TestOpenPaymentFormForContractPosting(unittest.TestCase):
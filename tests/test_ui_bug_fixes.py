@@ -10,8 +10,84 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import inspect
+import linecache
+import re
+import tkinter as tk
+import tkinter.ttk as ttk
+import types
 import unittest
-from unittest.mock import MagicMock, patch, call
+from functools import lru_cache
+from unittest.mock import MagicMock, call
+
+import app.mixins.lifecycle_mixin as lifecycle_mixin
+import ui.ui_actions as ui_actions
+from app.action_wrappers import ActionWrappersMixin
+from app.mixins.billing_mixin import BillingMixin
+from app.mixins.context_menu_mixin import ContextMenuMixin
+from app.mixins.lifecycle_mixin import LifecycleMixin
+from app.mixins.theme_language_mixin import ThemeLanguageMixin
+from app.mixins.trucks_tab_mixin import TrucksTabMixin
+from data.language_map import EN_TO_ZH
+from tabs import contracts_tab, invoices_tab
+from ui.ui_actions import (
+    generate_customer_invoice_pdf_for_customer_id_action,
+    refresh_contracts_action,
+    refresh_invoices_action,
+    toggle_contract_action,
+)
+from ui.ui_helpers import clear_inline_errors, get_entry_value, show_inline_error
+
+
+# Single-line source scans, compiled once; "." never crosses a newline.
+_FOCUSOUT_ADDITIVE_BIND = re.compile(r"<FocusOut>.*_on_contract_customer_changed.*\badd\s*=")
+_PLATE_ROW_HINT_LINE = re.compile(r"^.*Select a customer.*plate row.*$", re.MULTILINE)
+
+# Language-map keys for the Invoices tab hint, indexed once at import.
+_PLATE_HINT_KEYS = tuple(
+    key for key in EN_TO_ZH if "plate row" in key and "Select a customer" in key
+)
+
+
+@lru_cache(maxsize=None)
+def _src(obj):
+    """Return ``inspect.getsource(obj)``, reading each module or function once."""
+    return inspect.getsource(obj)
+
+
+@lru_cache(maxsize=None)
+def _module_text(mod):
+    """Return the full text of *mod*'s source file, read once via linecache."""
+    return "".join(linecache.getlines(mod.__file__))
+
+
+def _nested_code(fn):
+    """Yield *fn*'s code object and every code object nested inside it.
+
+    Decorated actions are unwrapped first, as ``inspect.getsource`` does.
+    """
+    stack = [inspect.unwrap(fn).__code__]
+    while stack:
+        code = stack.pop()
+        yield code
+        stack.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+
+
+@lru_cache(maxsize=None)
+def _code_names(fn):
+    """Return every identifier and string constant compiled into *fn*."""
+    names = set()
+    for code in _nested_code(fn):
+        names.update(code.co_names, code.co_varnames, code.co_freevars, code.co_cellvars)
+        names.update(c for c in code.co_consts if isinstance(c, str))
+    return frozenset(names)
+
+
+def _swap(test, target, name, value):
+    """Set ``target.name`` to *value* until *test* finishes, then restore it."""
+    test.addCleanup(setattr, target, name, getattr(target, name))
+    setattr(target, name, value)
+    return value
 
 
 # ---------------------------------------------------------------------------
@@ -27,21 +103,19 @@ class TestPdfLambdaExcCapture(unittest.TestCase):
 
     def test_error_msg_eagerly_bound(self):
         """Verify source code uses `error_msg = f\"...{exc}\"` before the lambda."""
-        import inspect
-        import ui.ui_actions as mod
-
-        source = inspect.getsource(mod.generate_customer_invoice_pdf_for_customer_id_action)
+        fn = ui_actions.generate_customer_invoice_pdf_for_customer_id_action
         # The fix stores the string before the lambda
-        self.assertIn("error_msg", source)
+        self.assertIn("error_msg", _code_names(fn))
         # Should NOT have the old pattern where exc is used inside the lambda
-        self.assertNotIn('lambda: _on_complete(False, f"Could not generate PDF:\\n{exc}")', source)
+        for code in _nested_code(fn):
+            if code.co_name == "<lambda>":
+                self.assertNotIn("exc", code.co_freevars)
 
-    @patch("ui.ui_actions.messagebox")
-    @patch("ui.ui_actions.threading")
-    @patch("ui.ui_actions.filedialog")
-    def test_pdf_in_progress_flag_reset_on_outer_error(self, mock_fd, mock_threading, mock_msg):
+    def test_pdf_in_progress_flag_reset_on_outer_error(self):
         """If the outer try raises, _pdf_export_in_progress must be reset."""
-        from ui.ui_actions import generate_customer_invoice_pdf_for_customer_id_action
+        _swap(self, ui_actions, "messagebox", MagicMock())
+        _swap(self, ui_actions, "threading", MagicMock())
+        mock_fd = _swap(self, ui_actions, "filedialog", MagicMock())
 
         app = MagicMock()
         app._pdf_export_in_progress = False
@@ -67,48 +141,27 @@ class TestPdfLambdaExcCapture(unittest.TestCase):
 class TestToggleContractEmptyValues(unittest.TestCase):
     """Right-clicking an empty tree row (no values tuple) must not crash."""
 
-    @patch("ui.ui_actions.messagebox")
-    def test_empty_values_shows_error(self, mock_msg):
-        from ui.ui_actions import toggle_contract_action
-
-        app = MagicMock()
-        app.contract_tree.selection.return_value = ("I001",)
-        # item(sel[0], "values") returns the values directly
-        app.contract_tree.item.return_value = ()  # empty tuple
-        db = MagicMock()
-
-        toggle_contract_action(app, db)
-
-        mock_msg.showerror.assert_called_once()
-        # Must not attempt int() on empty tuple
-        db.get_contract_active_row.assert_not_called()
-
-    @patch("ui.ui_actions.messagebox")
-    def test_no_selection_warns(self, mock_msg):
-        from ui.ui_actions import toggle_contract_action
-
-        app = MagicMock()
-        app.contract_tree.selection.return_value = ()
-        db = MagicMock()
-
-        toggle_contract_action(app, db)
-
-        mock_msg.showwarning.assert_called_once()
-
-    @patch("ui.ui_actions.messagebox")
-    def test_none_values_shows_error(self, mock_msg):
-        from ui.ui_actions import toggle_contract_action
-
-        app = MagicMock()
-        app.contract_tree.selection.return_value = ("I001",)
-        # item(sel[0], "values") returns None
-        app.contract_tree.item.return_value = None
-        db = MagicMock()
+    def test_bad_selection_is_reported_without_lookup(self):
+        mock_msg = _swap(self, ui_actions, "messagebox", MagicMock())
+        cases = (
+            # item(sel[0], "values") returns the values directly
+            ("empty_values", ("I001",), (), "showerror"),
+            ("no_selection", (), None, "showwarning"),
+            ("none_values", ("I001",), None, "showerror"),
+        )
+        for name, selection, values, dialog in cases:
+            with self.subTest(name=name):
+                mock_msg.reset_mock()
+                app = MagicMock()
+                app.contract_tree.selection.return_value = selection
+                app.contract_tree.item.return_value = values
+                db = MagicMock()
 
-        toggle_contract_action(app, db)
+                toggle_contract_action(app, db)
 
-        mock_msg.showerror.assert_called_once()
-        db.get_contract_active_row.assert_not_called()
+                getattr(mock_msg, dialog).assert_called_once()
+                # Must not attempt int() on missing values
+                db.get_contract_active_row.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -117,17 +170,21 @@ class TestToggleContractEmptyValues(unittest.TestCase):
 class TestContextMenuEmptyArea(unittest.TestCase):
     """Right-clicking empty space in a treeview must not show the menu."""
 
+    # Exactly what _show_tree_context_menu touches; anything else is a typo.
+    TREE_SPEC = ("identify_row", "selection_set", "focus")
+    MENU_SPEC = ("tk_popup", "grab_release")
+    EVENT_SPEC = ("y", "x_root", "y_root")
+
     def _make_mixin(self):
         """Create a minimal instance of the context menu mixin."""
-        from app.mixins.context_menu_mixin import ContextMenuMixin
         obj = object.__new__(ContextMenuMixin)
         return obj
 
     def test_no_popup_on_empty_row(self):
         mixin = self._make_mixin()
-        tree = MagicMock()
-        menu = MagicMock()
-        event = MagicMock()
+        tree = MagicMock(spec_set=self.TREE_SPEC)
+        menu = MagicMock(spec_set=self.MENU_SPEC)
+        event = MagicMock(spec_set=self.EVENT_SPEC)
 
         # identify_row returns "" when clicking empty area
         tree.identify_row.return_value = ""
@@ -140,9 +197,9 @@ class TestContextMenuEmptyArea(unittest.TestCase):
 
     def test_popup_on_valid_row(self):
         mixin = self._make_mixin()
-        tree = MagicMock()
-        menu = MagicMock()
-        event = MagicMock()
+        tree = MagicMock(spec_set=self.TREE_SPEC)
+        menu = MagicMock(spec_set=self.MENU_SPEC)
+        event = MagicMock(spec_set=self.EVENT_SPEC)
 
         tree.identify_row.return_value = "I001"
 
@@ -161,19 +218,12 @@ class TestFocusOutBindingAdditive(unittest.TestCase):
     """
 
     def test_bind_uses_add_plus(self):
-        import inspect
-        from tabs import contracts_tab
-
-        source = inspect.getsource(contracts_tab)
+        source = _module_text(contracts_tab)
         # Must contain add="+" for the FocusOut binding
         self.assertIn('add="+"', source)
         # Ensure it is on a FocusOut line
-        for line in source.splitlines():
-            if "<FocusOut>" in line and "_on_contract_customer_changed" in line:
-                self.assertIn("add", line)
-                break
-        else:
-            self.fail("No <FocusOut> binding found for _on_contract_customer_changed")
+        if not _FOCUSOUT_ADDITIVE_BIND.search(source):
+            self.fail("No additive <FocusOut> binding found for _on_contract_customer_changed")
 
 
 # ---------------------------------------------------------------------------
@@ -184,11 +234,7 @@ class TestLedgerDialogTransient(unittest.TestCase):
     on top of the main window."""
 
     def test_source_has_transient(self):
-        import inspect
-        import ui.ui_actions as mod
-
-        source = inspect.getsource(mod.show_customer_ledger_action)
-        self.assertIn("transient", source)
+        self.assertIn("transient", _code_names(ui_actions.show_customer_ledger_action))
 
 
 # ---------------------------------------------------------------------------
@@ -199,17 +245,28 @@ class TestInvoiceVisualTagsReapplied(unittest.TestCase):
     _apply_invoice_tree_visual_tags() after state change.
     """
 
-    def _make_billing_mixin(self):
-        from app.mixins.billing_mixin import BillingMixin
-        obj = object.__new__(BillingMixin)
-        obj.invoice_tree = MagicMock()
-        obj._apply_invoice_tree_visual_tags = MagicMock()
-        obj._update_invoice_parent_label = MagicMock()
-        obj._invoice_group_label = MagicMock(return_value="2 contracts")
-        return obj
+    @classmethod
+    def setUpClass(cls):
+        # One mixin and mock tree per class; setUp resets them between tests.
+        cls.mixin = object.__new__(BillingMixin)
+        cls.mixin.invoice_tree = MagicMock()
+        cls.mixin._apply_invoice_tree_visual_tags = MagicMock()
+        cls.mixin._update_invoice_parent_label = MagicMock()
+        cls.mixin._invoice_group_label = MagicMock()
+
+    def setUp(self):
+        mixin = self.mixin
+        for mock in (
+            mixin.invoice_tree,
+            mixin._apply_invoice_tree_visual_tags,
+            mixin._update_invoice_parent_label,
+            mixin._invoice_group_label,
+        ):
+            mock.reset_mock(return_value=True, side_effect=True)
+        mixin._invoice_group_label.return_value = "2 contracts"
 
     def test_toggle_parent_row_calls_visual_tags(self):
-        mixin = self._make_billing_mixin()
+        mixin = self.mixin
         mixin.invoice_tree.identify_row.return_value = "P001"
         mixin.invoice_tree.parent.return_value = ""  # it IS a parent
         mixin.invoice_tree.item.return_value = False  # not open
@@ -220,7 +277,7 @@ class TestInvoiceVisualTagsReapplied(unittest.TestCase):
         mixin._apply_invoice_tree_visual_tags.assert_called_once()
 
     def test_collapse_all_calls_visual_tags(self):
-        mixin = self._make_billing_mixin()
+        mixin = self.mixin
         mixin.invoice_tree.selection.return_value = ()
         # get_children("") returns parents, get_children(parent) returns children
         mixin.invoice_tree.get_children.side_effect = lambda p="": ["P1", "P2"] if p == "" else ["C1"]
@@ -236,7 +293,7 @@ class TestInvoiceVisualTagsReapplied(unittest.TestCase):
         mixin._apply_invoice_tree_visual_tags.assert_called_once()
 
     def test_expand_all_calls_visual_tags(self):
-        mixin = self._make_billing_mixin()
+        mixin = self.mixin
         mixin.invoice_tree.get_children.side_effect = lambda p="": ["P1"] if p == "" else ["C1"]
         def _item_handler(iid, key=None, **kwargs):
             if key == "values":
@@ -255,22 +312,22 @@ class TestInvoiceVisualTagsReapplied(unittest.TestCase):
 class TestReapplyInvoiceTreeSort(unittest.TestCase):
     """_reapply_invoice_tree_sort must re-sort and update column headings."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Only the mock tree is shared; each test gets a fresh mixin around it.
+        cls._invoice_tree = MagicMock()
+
     def _make_mixin(self, col="rate", rev=False):
-        from app.mixins.billing_mixin import BillingMixin
         obj = object.__new__(BillingMixin)
-        obj.invoice_tree = MagicMock()
-        obj.invoice_tree.__getitem__ = MagicMock(
-            return_value=("customer", "plate", "rate", "balance")
-        )
+        obj.invoice_tree = self._invoice_tree
+        obj.invoice_tree.reset_mock(return_value=True, side_effect=True)
+        obj.invoice_tree.__getitem__.return_value = ("customer", "plate", "rate", "balance")
         obj._invoice_sort_col = col
         obj._invoice_sort_rev = rev
-        obj._alphanum_key = lambda self_unused, v: v.lower() if isinstance(v, str) else v
-        # Bind the method properly
         obj._alphanum_key = lambda v: v.lower() if isinstance(v, str) else v
         return obj
 
     def test_no_col_returns_early(self):
-        from app.mixins.billing_mixin import BillingMixin
         obj = object.__new__(BillingMixin)
         obj.invoice_tree = MagicMock()
         # No _invoice_sort_col set at all
@@ -311,18 +368,11 @@ class TestReapplyInvoiceTreeSort(unittest.TestCase):
 
     def test_refresh_invoices_calls_reapply(self):
         """Confirm refresh_invoices_action source calls _reapply_invoice_tree_sort."""
-        import inspect
-        import ui.ui_actions as mod
-
-        source = inspect.getsource(mod.refresh_invoices_action)
-        self.assertIn("_reapply_invoice_tree_sort", source)
+        self.assertIn("_reapply_invoice_tree_sort", _code_names(ui_actions.refresh_invoices_action))
 
     def test_refresh_statement_uses_month_payment_range(self):
         """Monthly statement paid total should use selected-month payments only."""
-        import inspect
-        import ui.ui_actions as mod
-
-        source = inspect.getsource(mod.refresh_statement_action)
+        source = _src(ui_actions.refresh_statement_action)
         self.assertIn("get_paid_totals_by_contract_in_date_range", source)
 
 
@@ -334,67 +384,60 @@ class TestMutedForegroundRestore(unittest.TestCase):
     labels, not leave them with the dark-mode color on a white background.
     """
 
+    DARK_PALETTE = {
+        "text_widget_bg": "#1e1e1e",
+        "text_widget_fg": "#d4d4d4",
+        "muted_text": "#d5deea",
+        "surface_bg": "#2d2d30",
+        "text": "#cccccc",
+    }
+    LIGHT_PALETTE = {
+        "text_widget_bg": "#ffffff",
+        "text_widget_fg": "#000000",
+        "muted_text": "#d5deea",
+        "surface_bg": "#f0f0f0",
+        "text": "#000000",
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mixin = object.__new__(ThemeLanguageMixin)
+        # Building a spec'd mock introspects the whole ttk.Label API, so do it once.
+        cls.widget = MagicMock(spec=ttk.Label)
+
     def test_source_saves_and_restores_original(self):
         """_apply_theme_to_widget_tree must handle both directions."""
-        import inspect
-        from app.mixins.theme_language_mixin import ThemeLanguageMixin
-
-        source = inspect.getsource(ThemeLanguageMixin._apply_theme_to_widget_tree)
+        source = _src(ThemeLanguageMixin._apply_theme_to_widget_tree)
         # Must save original fg before overriding
         self.assertIn("_original_muted_fg", source)
         # Must restore in light mode
         self.assertIn("del root._original_muted_fg", source)
 
-    def test_dark_mode_saves_original_fg(self):
-        """When theme_mode=='dark', the original muted fg should be saved."""
-        from app.mixins.theme_language_mixin import ThemeLanguageMixin
-        import tkinter.ttk as ttk
-
-        mixin = object.__new__(ThemeLanguageMixin)
-        mixin.theme_mode = "dark"
-        mixin._theme_palette = {
-            "text_widget_bg": "#1e1e1e",
-            "text_widget_fg": "#d4d4d4",
-            "muted_text": "#d5deea",
-            "surface_bg": "#2d2d30",
-            "text": "#cccccc",
-        }
-
-        # Create a mock ttk.Label with muted fg
-        widget = MagicMock(spec=ttk.Label)
+    def test_dark_then_light_round_trip(self):
+        """Dark mode saves the original muted fg; light mode restores it."""
+        widget = self.widget
         widget.cget.return_value = "#777777"
         widget.winfo_children.return_value = []
 
-        mixin._apply_theme_to_widget_tree(widget)
-
-        # Should have saved original and configured new color
-        self.assertEqual(widget._original_muted_fg, "#777777")
-        widget.configure.assert_called_once_with(foreground="#d5deea")
-
-    def test_light_mode_restores_original_fg(self):
-        """When theme_mode=='light', saved original fg should be restored."""
-        from app.mixins.theme_language_mixin import ThemeLanguageMixin
-        import tkinter.ttk as ttk
-
-        mixin = object.__new__(ThemeLanguageMixin)
-        mixin.theme_mode = "light"
-        mixin._theme_palette = {
-            "text_widget_bg": "#ffffff",
-            "text_widget_fg": "#000000",
-            "muted_text": "#d5deea",
-            "surface_bg": "#f0f0f0",
-            "text": "#000000",
-        }
-
-        widget = MagicMock(spec=ttk.Label)
-        widget._original_muted_fg = "#777777"
-        widget.winfo_children.return_value = []
+        cases = (
+            ("dark", self.DARK_PALETTE, "#d5deea"),
+            ("light", self.LIGHT_PALETTE, "#777777"),
+        )
+        for mode, palette, expected_fg in cases:
+            with self.subTest(mode=mode):
+                widget.reset_mock()
+                self.mixin.theme_mode = mode
+                self.mixin._theme_palette = palette
 
-        mixin._apply_theme_to_widget_tree(widget)
+                self.mixin._apply_theme_to_widget_tree(widget)
 
-        widget.configure.assert_called_once_with(foreground="#777777")
-        # Attribute should be cleaned up
-        self.assertFalse(hasattr(widget, "_original_muted_fg"))
+                widget.configure.assert_called_once_with(foreground=expected_fg)
+                if mode == "dark":
+                    # Should have saved the original for the light-mode pass
+                    self.assertEqual(widget._original_muted_fg, "#777777")
+                else:
+                    # Attribute should be cleaned up
+                    self.assertFalse(hasattr(widget, "_original_muted_fg"))
 
 
 # ---------------------------------------------------------------------------
@@ -407,27 +450,18 @@ class TestInlineErrorMarkerDetection(unittest.TestCase):
 
     def test_show_inline_error_sets_marker(self):
         """show_inline_error must set _is_inline_error=True on the label."""
-        import inspect
-        from ui.ui_helpers import show_inline_error
-
-        source = inspect.getsource(show_inline_error)
+        source = _src(show_inline_error)
         self.assertIn("_is_inline_error = True", source)
 
     def test_clear_uses_marker_not_color(self):
         """clear_inline_errors must check _is_inline_error, not background."""
-        import inspect
-        from ui.ui_helpers import clear_inline_errors
-
-        source = inspect.getsource(clear_inline_errors)
-        self.assertIn("_is_inline_error", source)
+        names = _code_names(clear_inline_errors)
+        self.assertIn("_is_inline_error", names)
         # Must NOT check background color
-        self.assertNotIn('#ffebee', source)
+        self.assertFalse(any("#ffebee" in name for name in names))
 
     def test_clear_skips_label_without_marker(self):
         """A label with error background but no marker should be kept."""
-        import tkinter as tk
-        from ui.ui_helpers import clear_inline_errors
-
         # We mock the parent to avoid needing a real Tk instance
         parent = MagicMock()
         label_with_marker = MagicMock(spec=tk.Label)
@@ -453,34 +487,24 @@ class TestLanguageMapKeyMatch(unittest.TestCase):
     """
 
     def test_plate_row_key_exists(self):
-        from data.language_map import EN_TO_ZH
-
         hint_text = "  \u2190 Select a customer or plate row in the table below, then click an action"
         self.assertIn(hint_text, EN_TO_ZH)
 
     def test_contract_row_key_does_not_exist(self):
         """The old incorrect key must not be present."""
-        from data.language_map import EN_TO_ZH
-
         old_key = "  \u2190 Select a customer or contract row in the table below, then click an action"
         self.assertNotIn(old_key, EN_TO_ZH)
 
     def test_invoices_tab_hint_matches_language_map(self):
         """The actual widget text in invoices_tab.py must match a key in EN_TO_ZH."""
-        import inspect
-        from tabs import invoices_tab
-        from data.language_map import EN_TO_ZH
-
-        source = inspect.getsource(invoices_tab)
+        source = _module_text(invoices_tab)
         # Find the hint text used in the widget
-        for line in source.splitlines():
-            if "plate row" in line and "Select a customer" in line:
-                # Extract the string literal
-                for key in EN_TO_ZH:
-                    if "plate row" in key and "Select a customer" in key:
-                        self.assertIn(key.strip(), line)
-                        return
-        self.fail("Could not find 'plate row' hint in invoices_tab source")
+        match = _PLATE_ROW_HINT_LINE.search(source)
+        if match is None:
+            self.fail("Could not find 'plate row' hint in invoices_tab source")
+        if not _PLATE_HINT_KEYS:
+            self.fail("No 'plate row' hint key in EN_TO_ZH")
+        self.assertIn(_PLATE_HINT_KEYS[0].strip(), match.group())
 
 
 # ---------------------------------------------------------------------------
@@ -493,12 +517,14 @@ class TestBillingTabRefreshOnSwitch(unittest.TestCase):
     the customer filter field had text.
     """
 
-    @patch("app.mixins.lifecycle_mixin.on_tab_changed_action")
-    def test_switching_to_billing_syncs_and_refreshes(self, mock_tab_action):
-        from app.mixins.lifecycle_mixin import LifecycleMixin
+    NOTEBOOK_SPEC = ("select",)
+
+    def setUp(self):
+        _swap(self, lifecycle_mixin, "on_tab_changed_action", MagicMock())
 
+    def test_switching_to_billing_syncs_and_refreshes(self):
         mixin = object.__new__(LifecycleMixin)
-        mixin.main_notebook = MagicMock()
+        mixin.main_notebook = MagicMock(spec_set=self.NOTEBOOK_SPEC)
         mixin.tab_contracts = MagicMock()
         mixin.tab_billing = MagicMock()
         mixin._tab_has_unsaved_data = MagicMock(return_value=False)
@@ -510,17 +536,15 @@ class TestBillingTabRefreshOnSwitch(unittest.TestCase):
         # Simulate switching to billing tab
         mixin.main_notebook.select.return_value = str(mixin.tab_billing)
 
-        mixin._on_tab_changed(MagicMock())
+        # on_tab_changed_action is swapped out, so nothing reads the event
+        mixin._on_tab_changed(MagicMock(spec_set=()))
 
         mixin._sync_search_boxes_from_truck_search.assert_called_once()
         mixin._on_billing_tab_changed.assert_called_once()
 
-    @patch("app.mixins.lifecycle_mixin.on_tab_changed_action")
-    def test_switching_to_other_tab_does_not_refresh_billing(self, mock_tab_action):
-        from app.mixins.lifecycle_mixin import LifecycleMixin
-
+    def test_switching_to_other_tab_does_not_refresh_billing(self):
         mixin = object.__new__(LifecycleMixin)
-        mixin.main_notebook = MagicMock()
+        mixin.main_notebook = MagicMock(spec_set=self.NOTEBOOK_SPEC)
         mixin.tab_contracts = MagicMock()
         mixin.tab_billing = MagicMock()
         mixin.tab_dashboard = MagicMock()
@@ -534,7 +558,8 @@ class TestBillingTabRefreshOnSwitch(unittest.TestCase):
         # Simulate switching to dashboard (not billing, not contracts)
         mixin.main_notebook.select.return_value = str(mixin.tab_dashboard)
 
-        mixin._on_tab_changed(MagicMock())
+        # on_tab_changed_action is swapped out, so nothing reads the event
+        mixin._on_tab_changed(MagicMock(spec_set=()))
 
         mixin._on_billing_tab_changed.assert_not_called()
 
@@ -548,37 +573,25 @@ class TestPlaceholderNotUsedAsFilter(unittest.TestCase):
 
     def test_refresh_invoices_uses_get_entry_value(self):
         """refresh_invoices_action must use get_entry_value, not raw .get()."""
-        import inspect
-        from ui.ui_actions import refresh_invoices_action
-
-        src = inspect.getsource(refresh_invoices_action)
+        src = _src(refresh_invoices_action)
         self.assertIn("get_entry_value", src)
         self.assertNotIn("invoice_customer_search.get()", src)
 
     def test_refresh_overdue_uses_get_entry_value(self):
         """refresh_overdue wrapper must use get_entry_value, not raw .get()."""
-        import inspect
-        from app.action_wrappers import ActionWrappersMixin
-
-        src = inspect.getsource(ActionWrappersMixin.refresh_overdue)
+        src = _src(ActionWrappersMixin.refresh_overdue)
         self.assertIn("get_entry_value", src)
         self.assertNotIn("overdue_search.get()", src)
 
     def test_refresh_contracts_uses_get_entry_value(self):
         """refresh_contracts_action must use get_entry_value, not raw .get()."""
-        import inspect
-        from ui.ui_actions import refresh_contracts_action
-
-        src = inspect.getsource(refresh_contracts_action)
+        src = _src(refresh_contracts_action)
         self.assertIn("get_entry_value", src)
         self.assertNotIn("contract_search.get()", src)
 
     def test_sync_search_boxes_uses_get_entry_value(self):
         """_sync_search_boxes_from_truck_search must use get_entry_value."""
-        import inspect
-        from app.mixins.trucks_tab_mixin import TrucksTabMixin
-
-        src = inspect.getsource(TrucksTabMixin._sync_search_boxes_from_truck_search)
+        src = _src(TrucksTabMixin._sync_search_boxes_from_truck_search)
         self.assertIn("get_entry_value", src)
         # Raw .get() should only remain for truck_search (no placeholder)
         self.assertNotIn("contract_search.get()", src)
@@ -586,9 +599,6 @@ class TestPlaceholderNotUsedAsFilter(unittest.TestCase):
 
     def test_get_entry_value_returns_empty_for_placeholder(self):
         """get_entry_value returns '' when placeholder is active."""
-        from ui.ui_helpers import get_entry_value
-        from unittest.mock import MagicMock
-
         entry = MagicMock()
         entry._has_placeholder = True
         entry.get.return_value = "Filter by customer..."
@@ -596,9 +606,6 @@ class TestPlaceholderNotUsedAsFilter(unittest.TestCase):
 
     def test_get_entry_value_returns_text_when_no_placeholder(self):
         """get_entry_value returns the actual text when user has typed."""
-        from ui.ui_helpers import get_entry_value
-        from unittest.mock import MagicMock
-
         entry = MagicMock()
         entry._has_placeholder = False
         entry.get.return_value = "John"
@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import unittest
 import tkinter as tk
 from tkinter import ttk
+from unittest.mock import MagicMock
 
 from ui.ui_helpers import (
     get_entry_value,
@@ -17,33 +18,63 @@ from ui.ui_helpers import (
 )
 from utils.billing_date_utils import today
 
+_ROOT = None
+
+
+def tearDownModule():
+    """Destroy the shared root window, if any test created it."""
+    if _ROOT is not None:
+        _ROOT.destroy()
+
+
+def _mock_entry(text="", has_placeholder=None):
+    """Return a mock entry whose get() yields *text*.
+
+    With *has_placeholder* left as None the entry has no placeholder
+    attribute at all, like a plain ttk.Entry.
+    """
+    if has_placeholder is None:
+        entry = MagicMock(spec_set=("get",))
+    else:
+        entry = MagicMock(spec_set=("get", "_has_placeholder", "_placeholder_text"))
+        entry._has_placeholder = has_placeholder
+    entry.get.return_value = text
+    return entry
 
-class TestGetEntryValue(unittest.TestCase):
-    """Test get_entry_value function."""
+
+class _TkTestCase(unittest.TestCase):
+    """Give each test a fresh container frame under the shared root."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the withdrawn root window shared by every Tk test in the module."""
+        global _ROOT
+        if _ROOT is None:
+            _ROOT = tk.Tk()
+            _ROOT.withdraw()
 
     def setUp(self):
-        """Create a root window for testing."""
-        self.root = tk.Tk()
-        self.root.withdraw()
+        """Create a container frame for this test's widgets."""
+        self.container = tk.Frame(_ROOT)
 
     def tearDown(self):
-        """Destroy the root window."""
-        self.root.destroy()
+        """Destroy the container frame and every widget inside it."""
+        self.container.destroy()
+
+
+class TestGetEntryValue(unittest.TestCase):
+    """Test get_entry_value function."""
 
     def test_get_entry_value_normal(self):
         """Test getting value from normal entry."""
-        entry = ttk.Entry(self.root)
-        entry.insert(0, "test value")
-        entry._has_placeholder = False
+        entry = _mock_entry("test value", has_placeholder=False)
         
         result = get_entry_value(entry)
         assert result == "test value"
 
     def test_get_entry_value_with_placeholder(self):
         """Test that placeholder text is not returned."""
-        entry = ttk.Entry(self.root)
-        entry.insert(0, "placeholder")
-        entry._has_placeholder = True
+        entry = _mock_entry("placeholder", has_placeholder=True)
         entry._placeholder_text = "placeholder"
         
         result = get_entry_value(entry)
@@ -51,16 +82,14 @@ class TestGetEntryValue(unittest.TestCase):
 
     def test_get_entry_value_empty(self):
         """Test getting value from empty entry."""
-        entry = ttk.Entry(self.root)
-        entry._has_placeholder = False
+        entry = _mock_entry(has_placeholder=False)
         
         result = get_entry_value(entry)
         assert result == ""
 
     def test_get_entry_value_no_placeholder_attr(self):
         """Test entry without placeholder attribute."""
-        entry = ttk.Entry(self.root)
-        entry.insert(0, "value")
+        entry = _mock_entry("value")
         # No _has_placeholder attribute
         
         result = get_entry_value(entry)
@@ -68,18 +97,14 @@ class TestGetEntryValue(unittest.TestCase):
 
     def test_get_entry_value_with_special_chars(self):
         """Test entry value with special characters."""
-        entry = ttk.Entry(self.root)
-        entry.insert(0, "Test@#$%^&*()")
-        entry._has_placeholder = False
+        entry = _mock_entry("Test@#$%^&*()", has_placeholder=False)
         
         result = get_entry_value(entry)
         assert result == "Test@#$%^&*()"
 
     def test_get_entry_value_with_unicode(self):
         """Test entry value with unicode characters."""
-        entry = ttk.Entry(self.root)
-        entry.insert(0, "你好世界")
-        entry._has_placeholder = False
+        entry = _mock_entry("你好世界", has_placeholder=False)
         
         result = get_entry_value(entry)
         assert result == "你好世界"
@@ -88,129 +113,103 @@ class TestGetEntryValue(unittest.TestCase):
 class TestClearInlineErrors(unittest.TestCase):
     """Test clear_inline_errors function."""
 
-    def setUp(self):
-        """Create a root window for testing."""
-        self.root = tk.Tk()
-        self.root.withdraw()
+    @staticmethod
+    def _parent(*children):
+        """Return a mock parent whose winfo_children() yields *children*."""
+        parent = MagicMock()
+        parent.winfo_children.return_value = list(children)
+        return parent
 
-    def tearDown(self):
-        """Destroy the root window."""
-        self.root.destroy()
+    @staticmethod
+    def _error_label():
+        """Return a mock label carrying the inline-error marker."""
+        label = MagicMock(spec=tk.Label)
+        label._is_inline_error = True
+        return label
 
     def test_clear_no_errors(self):
         """Test clearing when no errors exist."""
-        frame = tk.Frame(self.root)
-        frame.pack()
-        
         # Should not raise
-        clear_inline_errors(frame)
+        clear_inline_errors(self._parent())
 
     def test_clear_error_labels(self):
         """Test clearing error labels."""
-        frame = tk.Frame(self.root)
-        frame.pack()
-        
-        # Create error labels with marker attribute
-        error1 = tk.Label(frame, background="#ffebee")
-        error1._is_inline_error = True
-        error1.grid()
-        
-        error2 = tk.Label(frame, background="#ffebee")
-        error2._is_inline_error = True
-        error2.grid()
-        
-        # Create non-error label
-        normal = tk.Label(frame, background="white")
-        normal.grid()
-        
-        # Clear errors
-        clear_inline_errors(frame)
-        
+        error1 = self._error_label()
+        error2 = self._error_label()
+        normal = MagicMock(spec=tk.Label)
+
+        clear_inline_errors(self._parent(error1, error2, normal))
+
         # Error labels should be hidden
-        assert error1.grid_info() == {}
-        assert error2.grid_info() == {}
+        error1.grid_forget.assert_called_once()
+        error2.grid_forget.assert_called_once()
         # Normal label should still be visible
-        assert normal.grid_info() != {}
+        normal.grid_forget.assert_not_called()
 
     def test_clear_preserves_non_error_widgets(self):
         """Test that non-error widgets are preserved."""
-        frame = tk.Frame(self.root)
-        frame.pack()
-        
-        # Create various widgets
-        button = tk.Button(frame, text="Test")
-        button.grid()
-        
-        entry = tk.Entry(frame)
-        entry.grid()
-        
-        error = tk.Label(frame, background="#ffebee")
-        error._is_inline_error = True
-        error.grid()
-        
-        # Clear errors
-        clear_inline_errors(frame)
-        
+        button = MagicMock(spec=tk.Button)
+        entry = MagicMock(spec=tk.Entry)
+        error = self._error_label()
+
+        clear_inline_errors(self._parent(button, entry, error))
+
         # Non-error widgets should still be visible
-        assert button.grid_info() != {}
-        assert entry.grid_info() != {}
+        button.grid_forget.assert_not_called()
+        entry.grid_forget.assert_not_called()
         # Error should be hidden
-        assert error.grid_info() == {}
+        error.grid_forget.assert_called_once()
 
 
 class TestEntryValueExtraction(unittest.TestCase):
     """Test extraction of values from various entry configurations."""
 
-    def setUp(self):
-        """Create a root window for testing."""
-        self.root = tk.Tk()
-        self.root.withdraw()
-
-    def tearDown(self):
-        """Destroy the root window."""
-        self.root.destroy()
-
     def test_entry_value_long_string(self):
         """Test entry with long string value."""
-        entry = ttk.Entry(self.root)
         long_string = "a" * 1000
-        entry.insert(0, long_string)
-        entry._has_placeholder = False
+        entry = _mock_entry(long_string, has_placeholder=False)
         
         result = get_entry_value(entry)
         assert result == long_string
 
     def test_entry_value_with_leading_trailing_spaces(self):
         """Test entry preserves leading/trailing spaces."""
-        entry = ttk.Entry(self.root)
-        entry.insert(0, "  spaced value  ")
-        entry._has_placeholder = False
+        entry = _mock_entry("  spaced value  ", has_placeholder=False)
         
         result = get_entry_value(entry)
         assert result == "  spaced value  "
 
     def test_entry_value_numbers(self):
         """Test entry with numeric value."""
-        entry = ttk.Entry(self.root)
-        entry.insert(0, "123456789")
-        entry._has_placeholder = False
+        entry = _mock_entry("123456789", has_placeholder=False)
         
         result = get_entry_value(entry)
         assert result == "123456789"
 
     def test_entry_value_empty_vs_placeholder(self):
         """Test distinction between empty and placeholder."""
-        entry1 = ttk.Entry(self.root)
-        entry1._has_placeholder = False
+        entry1 = _mock_entry(has_placeholder=False)
         
-        entry2 = ttk.Entry(self.root)
-        entry2.insert(0, "placeholder")
-        entry2._has_placeholder = True
+        entry2 = _mock_entry("placeholder", has_placeholder=True)
         
         assert get_entry_value(entry1) == ""
         assert get_entry_value(entry2) == ""
         assert get_entry_value(entry1) == get_entry_value(entry2)
 
 
+class TestGetEntryValueRealWidget(_TkTestCase):
+    """Smoke-test get_entry_value against a real ttk.Entry."""
+
+    def test_real_entry_value_and_placeholder(self):
+        """A real entry returns its text until flagged as showing a placeholder."""
+        entry = ttk.Entry(self.container)
+        entry.insert(0, "test value")
+        entry._has_placeholder = False
+        assert get_entry_value(entry) == "test value"
+
+        entry._has_placeholder = True
+        assert get_entry_value(entry) == ""
+
+
 if __name__ == "__main__":
     unittest.main()
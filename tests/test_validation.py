@@ -9,6 +9,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import unittest
+from unittest.mock import Mock, patch
+
+from core.config import PLATE_PATTERN
 from utils.validation import (
     normalize_whitespace,
     required_text,
@@ -123,6 +126,22 @@ class TestOptionalPhone(unittest.TestCase):
             optional_phone("invalid")
         assert "format" in str(cm.exception).lower()
 
+    def test_fullwidth_digits_fold_to_ascii(self):
+        """Test that fullwidth digits and punctuation are folded to ASCII."""
+        assert optional_phone("（５５５）１２３－４５６７") == "(555)123-4567"
+
+    def test_digit_only_phone_length_bounds(self):
+        """Test that bare digit strings still obey the 7-20 length limit."""
+        assert optional_phone("5551234") == "5551234"
+        for digits in ("555123", "5" * 21):
+            with self.assertRaises(ValueError):
+                optional_phone(digits)
+
+    def test_non_ascii_digits_rejected(self):
+        """Test that digits NFKC leaves non-ASCII are not accepted."""
+        with self.assertRaises(ValueError):
+            optional_phone("٥٥٥١٢٣٤٥٦٧")
+
 
 class TestRequiredPlate(unittest.TestCase):
     """Test required_plate validation."""
@@ -148,6 +167,15 @@ class TestRequiredPlate(unittest.TestCase):
         result = required_plate("ABC—1234")  # em dash
         assert result == "ABC-1234"
 
+    def test_plate_fullwidth_folds_to_ascii(self):
+        """Test that fullwidth letters and digits are folded to ASCII."""
+        assert required_plate("ＡＢＣ－１２３４") == "ABC-1234"
+
+    def test_plate_unicode_hyphen_and_minus_normalization(self):
+        """Test that unicode hyphens and the minus sign are normalized."""
+        for dash in ("\u2010", "\u2011", "\u2212"):
+            assert required_plate(f"ABC{dash}1234") == "ABC-1234"
+
     def test_plate_with_space(self):
         """Test plate with space."""
         result = required_plate("ABC 1234")
@@ -163,6 +191,19 @@ class TestRequiredPlate(unittest.TestCase):
         with self.assertRaises(ValueError):
             required_plate("ABC@1234")
 
+    def test_plate_non_ascii_letters_rejected(self):
+        """Test that accented letters are not accepted as plain alphanumerics."""
+        with self.assertRaises(ValueError):
+            required_plate("ÉCOLE1")
+
+    def test_plate_single_regex_pass(self):
+        """Test that a plate is checked with exactly one pattern match."""
+        required_plate.cache_clear()
+        counting = Mock(wraps=PLATE_PATTERN)
+        with patch("utils.validation.PLATE_PATTERN", counting):
+            assert required_plate("ABC-1234") == "ABC-1234"
+        assert len(counting.method_calls) == 1
+
 
 class TestOptionalState(unittest.TestCase):
     """Test optional_state validation."""
@@ -238,6 +279,12 @@ class TestPositiveFloat(unittest.TestCase):
             positive_float("Price", "abc")
         assert "numeric" in str(cm.exception).lower()
 
+    def test_underscore_grouping_rejected(self):
+        """Test that float()'s underscore digit grouping is not accepted."""
+        with self.assertRaises(ValueError) as cm:
+            positive_float("Price", "1_000")
+        assert "numeric" in str(cm.exception).lower()
+
 
 class TestPositiveInt(unittest.TestCase):
     """Test positive_int validation."""
@@ -276,5 +323,28 @@ class TestPositiveInt(unittest.TestCase):
             positive_int("Count", "abc")
 
 
+class TestValidatorCache(unittest.TestCase):
+    """Test memoization of the validators."""
+
+    def test_repeated_call_hits_cache(self):
+        """Test identical inputs are served from the cache."""
+        required_plate.cache_clear()
+        first = required_plate("abc-1234")
+        second = required_plate("abc-1234")
+        assert first == second == "ABC-1234"
+        assert required_plate.cache_info().hits == 1
+
+    def test_invalid_input_raises_every_time(self):
+        """Test failures are not cached."""
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                optional_state("Texas")
+
+    def test_unhashable_input_falls_through(self):
+        """Test unhashable arguments bypass the cache."""
+        with self.assertRaises(AttributeError):
+            required_text("Name", ["not", "a", "string"])
+
+
 if __name__ == "__main__":
     unittest.main()
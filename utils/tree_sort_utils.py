@@ -5,6 +5,9 @@ from tkinter import ttk
 
 from utils.validation import normalize_whitespace
 
+_NUMERIC_RE = re.compile(r"-?\d+(\.\d+)?")
+_DIGIT_RUN_RE = re.compile(r"(\d+)")
+
 
 def heading_text_without_sort_marker(text: str) -> str:
     return text.removesuffix(" ▲").removesuffix(" ▼")
@@ -16,10 +19,10 @@ def alphanum_key(value: str) -> tuple:
         return (2,)
 
     numeric = normalized.replace("$", "").replace(",", "")
-    if re.fullmatch(r"-?\d+(\.\d+)?", numeric):
+    if _NUMERIC_RE.fullmatch(numeric):
         return (0, float(numeric))
 
-    parts = re.split(r"(\d+)", normalized.lower())
+    parts = _DIGIT_RUN_RE.split(normalized.lower())
     key_parts = []
     for part in parts:
         if part == "":
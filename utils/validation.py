@@ -1,14 +1,43 @@
 from __future__ import annotations
 
 import math
+import unicodedata
+from functools import lru_cache, wraps
 
-from core.config import PHONE_PATTERN, PLATE_PATTERN, STATE_PATTERN
+from core.config import DECIMAL_PATTERN, PHONE_PATTERN, PLATE_PATTERN, STATE_PATTERN
+
+# Em dash, en dash, hyphen, non-breaking hyphen and minus sign -> ASCII "-".
+_DASH_TRANSLATE = str.maketrans(dict.fromkeys("\u2014\u2013\u2010\u2011\u2212", "-"))
+# Currency symbol and thousands separators dropped from amounts in one pass.
+_CURRENCY_STRIP = str.maketrans("", "", "$,")
+
+
+def _memoized(func):
+    """Cache a pure validator's result for repeated identical inputs.
+
+    Calls with unhashable arguments fall through to the uncached function.
+    Failures are not cached, so invalid input raises on every call.
+    """
+    cached = lru_cache(maxsize=1024)(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return cached(*args, **kwargs)
+        except TypeError:
+            return func(*args, **kwargs)
+
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
 
 
 def normalize_whitespace(value: str) -> str:
-    return " ".join(value.strip().split())
+    # split() with no separator already drops leading/trailing whitespace.
+    return " ".join(value.split())
 
 
+@_memoized
 def required_text(label: str, value: str, max_len: int = 100) -> str:
     cleaned = normalize_whitespace(value)
     if not cleaned:
@@ -18,6 +47,7 @@ def required_text(label: str, value: str, max_len: int = 100) -> str:
     return cleaned
 
 
+@_memoized
 def optional_text(label: str, value: str, max_len: int = 200) -> str | None:
     cleaned = normalize_whitespace(value)
     if not cleaned:
@@ -27,26 +57,35 @@ def optional_text(label: str, value: str, max_len: int = 200) -> str | None:
     return cleaned
 
 
+@_memoized
 def optional_phone(value: str) -> str | None:
-    cleaned = normalize_whitespace(value)
+    cleaned = normalize_whitespace(unicodedata.normalize("NFKC", value))
     if not cleaned:
         return None
+    # Bare ASCII digits of a valid length need no regex pass.
+    if 7 <= len(cleaned) <= 20 and cleaned.isascii() and cleaned.isdigit():
+        return cleaned
     if not PHONE_PATTERN.fullmatch(cleaned):
         raise ValueError("Phone format is invalid.")
     return cleaned
 
 
+@_memoized
 def required_plate(value: str) -> str:
-    cleaned = normalize_whitespace(value).upper().replace("—", "-").replace("–", "-")
+    cleaned = normalize_whitespace(unicodedata.normalize("NFKC", value)).upper().translate(_DASH_TRANSLATE)
     if not cleaned:
         raise ValueError("Plate is required.")
+    # Plain ASCII letters/digits (already upper-cased) skip the regex pass.
+    if 2 <= len(cleaned) <= 15 and cleaned.isascii() and cleaned.isalnum():
+        return cleaned
     if not PLATE_PATTERN.fullmatch(cleaned):
         raise ValueError("Plate must be 2-15 chars (A-Z, 0-9, dash, space).")
     return cleaned
 
 
+@_memoized
 def optional_state(value: str) -> str | None:
-    cleaned = normalize_whitespace(value).upper()
+    cleaned = normalize_whitespace(unicodedata.normalize("NFKC", value)).upper()
     if not cleaned:
         return None
     if not STATE_PATTERN.fullmatch(cleaned):
@@ -54,14 +93,17 @@ def optional_state(value: str) -> str | None:
     return cleaned
 
 
+@_memoized
 def positive_float(label: str, value: str) -> float:
-    cleaned = normalize_whitespace(value).replace("$", "").replace(",", "")
+    cleaned = normalize_whitespace(value).translate(_CURRENCY_STRIP)
     if not cleaned:
         raise ValueError(f"{label} is required.")
-    try:
-        number = float(cleaned)
-    except ValueError:
+    # Rejects inf/nan spellings and junk before float() parses them. This is
+    # stricter than float(): underscore grouping such as "1_000" is refused.
+    if not DECIMAL_PATTERN.fullmatch(cleaned):
         raise ValueError(f"{label} must be numeric.")
+    number = float(cleaned)
+    # Still needed: in-range literals such as "1e999" overflow to inf.
     if not math.isfinite(number):
         raise ValueError(f"{label} must be numeric.")
     if number <= 0:
@@ -69,6 +111,7 @@ def positive_float(label: str, value: str) -> float:
     return number
 
 
+@_memoized
 def positive_int(label: str, value: str) -> int:
     cleaned = normalize_whitespace(value)
     if not cleaned: